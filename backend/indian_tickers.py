@@ -90,17 +90,18 @@ INDIAN_TICKERS = [
 ]
 
 # Validation: Ensure no duplicates
-_duplicates = [ticker for ticker in INDIAN_TICKERS if INDIAN_TICKERS.count(ticker) > 1]
+_seen = set()
+_duplicates = {ticker for ticker in INDIAN_TICKERS if ticker in _seen or _seen.add(ticker)}
 if _duplicates:
-    raise ValueError(f"Duplicate tickers found in INDIAN_TICKERS: {set(_duplicates)}")
+    raise ValueError(f"Duplicate tickers found in INDIAN_TICKERS: {_duplicates}")
 
 # Alternative: Pure NSE symbols without .NS suffix (if API doesn't need it)
 INDIAN_TICKERS_NSE_ONLY = [
-    ticker.replace(".NS", "") for ticker in INDIAN_TICKERS
+    ticker.removesuffix(".NS") for ticker in INDIAN_TICKERS
 ]
 
 # Alternative: BSE format (.BO suffix)
 INDIAN_TICKERS_BSE = [
-    ticker.replace(".NS", ".BO") for ticker in INDIAN_TICKERS
+    f"{symbol}.BO" for symbol in INDIAN_TICKERS_NSE_ONLY
 ]
 
@@ -1,44 +1,287 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import multiprocessing
+import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
 
+import asyncio
 import datetime as dt
+import hashlib
+import io
+import logging
+import urllib.parse
+import uuid
+import warnings
 
-from fastapi import FastAPI, HTTPException
+import numpy as np
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
 from textblob import TextBlob
-import yfinance as yf
 
 # Import US and Indian tickers
 from backend.us_tickers import US_TICKERS
 from backend.indian_tickers import INDIAN_TICKERS
 from backend.sector_mapping import get_sector, get_all_sectors
+from backend.yf_pool import get_ticker, with_retry
+
+# yfinance/pandas deprecation chatter; installed once here rather than on
+# every fetch (filterwarnings locks and rewrites the global filter list)
+warnings.filterwarnings("ignore", category=FutureWarning)
+warnings.filterwarnings("ignore", category=UserWarning)
 
 # Ticker universe: Combine US and Indian stocks
 TICKERS: List[str] = US_TICKERS + INDIAN_TICKERS
+_TICKER_SET: frozenset = frozenset(TICKERS)  # O(1) membership checks
+_TICKER_INDEX: Dict[str, int] = {t: i for i, t in enumerate(TICKERS)}  # row in per-ticker arrays
 
 # Simple in-memory cache with TTL (Time-To-Live)
-_cache: Dict[str, tuple] = {}  # key -> (data, timestamp)
+_cache: Dict[str, tuple] = {}  # key -> (data, expires_at)
+_cache_lock = threading.RLock()  # entries are read/written from worker threads
 CACHE_TTL = 300  # 5 minutes in seconds
+CACHE_KEY_VERSION = "v1"  # bump when a cached payload's shape changes
+
+
+def _cache_key(*parts: str) -> str:
+    """Cache key as kind:...:version, e.g. news:all:v1 or technical:AAPL:6mo:v1."""
+    return ":".join((*parts, CACHE_KEY_VERSION))
+
+
+# Key -> TTL table:
+#   news:all / news:{ticker} / sentiment:all / recommendations:all   CACHE_TTL (5 min)
+#   history:{ticker}:1mo                                             PRICE_CACHE_TTL (1 h)
+#   technical:{ticker}:{period}                                      TECHNICAL_CACHE_TTL (1 h)
+#   fundamental:{ticker}                                             FUNDAMENTAL_CACHE_TTL (6 h)
+NEWS_CACHE_KEY = _cache_key("news", "all")
+SENTIMENT_CACHE_KEY = _cache_key("sentiment", "all")
+RECOMMENDATIONS_CACHE_KEY = _cache_key("recommendations", "all")
+# Attach technicals/fundamentals to /recommendations (one bulk fetch per refresh).
+# Off by default: 100+ tickers of yfinance history/info is too slow for Render.
+MCP_ENRICH_RECOMMENDATIONS = os.getenv("MCP_ENRICH_RECOMMENDATIONS", "0").strip() == "1"
+NEWS_FETCH_TIMEOUT = 60  # overall deadline for one /news fan-out, in seconds
+PRICE_CACHE_TTL = 3600  # 1 hour for 30-day price history
+TECHNICAL_CACHE_TTL = 3600  # indicators move with daily bars
+FUNDAMENTAL_CACHE_TTL = 6 * 3600  # valuation/financials change slowly
+PRICE_PREFETCH = os.getenv("PRICE_PREFETCH", "1").strip() != "0"  # bulk-load price history in the background
+PRICE_PREFETCH_INTERVAL = PRICE_CACHE_TTL - 300  # refresh before the cached bars expire
+_cache_stats = {"hits": 0, "misses": 0}  # in-memory cache counters, reported by /health
 
 
 def _get_cache(key: str) -> Optional[any]:
     """Get cached data if still valid."""
-    if key not in _cache:
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and time.time() > entry[1]:
+            del _cache[key]
+            entry = None
+        _cache_stats["hits" if entry is not None else "misses"] += 1
+        return entry[0] if entry is not None else None
+
+
+def _set_cache(key: str, data: any, ttl: int = CACHE_TTL) -> None:
+    """Store data in cache, expiring after `ttl` seconds."""
+    with _cache_lock:
+        _cache[key] = (data, time.time() + ttl)
+
+
+# One lock per cache key so concurrent misses trigger a single rebuild: the
+# first thread refreshes, the others wait and then read the fresh entry.
+_refresh_locks: Dict[str, threading.Lock] = {}
+
+
+def _refresh_lock(key: str) -> threading.Lock:
+    with _cache_lock:
+        lock = _refresh_locks.get(key)
+        if lock is None:
+            lock = _refresh_locks[key] = threading.Lock()
+        return lock
+
+
+# Optional shared cache (Redis) so several uvicorn workers reuse one news
+# refresh instead of each paying for its own. Enabled by REDIS_URL; values are
+# orjson-encoded, so only JSON-safe data (the news lists) is stored there and
+# every worker keeps its own in-memory copy on top.
+REDIS_URL = os.getenv("REDIS_URL", "").strip()
+REDIS_RETRY_AFTER = 60  # seconds to skip Redis after a connection error
+_redis = None
+_redis_lock = threading.Lock()
+_redis_down_until = 0.0
+
+
+def _get_redis():
+    """Lazily connect to REDIS_URL; None when unset, unavailable or recently unreachable."""
+    global _redis, REDIS_URL
+    if not REDIS_URL or time.time() < _redis_down_until:
         return None
-    data, timestamp = _cache[key]
-    if time.time() - timestamp > CACHE_TTL:
-        del _cache[key]
+    with _redis_lock:
+        if _redis is None:
+            try:
+                import redis
+
+                _redis = redis.Redis.from_url(REDIS_URL, decode_responses=False, socket_timeout=2)
+            except Exception as e:
+                print(f"Redis unavailable, using in-process cache only: {e}")
+                REDIS_URL = ""
+                return None
+    return _redis
+
+
+def _redis_failed(action: str, exc: Exception) -> None:
+    """
+    Log a Redis error; on a connection error or timeout, skip Redis for
+    REDIS_RETRY_AFTER seconds so callers don't each block on socket_timeout.
+    """
+    global _redis_down_until
+    import redis
+
+    print(f"{action}: {exc}")
+    if isinstance(exc, (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)):
+        _redis_down_until = time.time() + REDIS_RETRY_AFTER
+        print(f"Redis unreachable; using in-process cache only for {REDIS_RETRY_AFTER}s")
+
+
+def _get_shared_many(keys: List[str]) -> List[Optional[tuple]]:
+    """(data, seconds_left) for each key in the shared cache, None on a miss."""
+    client = _get_redis()
+    if client is None or not keys:
+        return [None] * len(keys)
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.get(key)
+            pipe.ttl(key)
+        replies = pipe.execute()
+    except Exception as e:
+        _redis_failed("Redis read failed", e)
+        return [None] * len(keys)
+    return [
+        (orjson.loads(raw), max(int(ttl), 1)) if raw is not None else None
+        for raw, ttl in zip(replies[::2], replies[1::2])
+    ]
+
+
+def _set_shared(key: str, data: any, ttl: int = CACHE_TTL) -> None:
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, orjson.dumps(data))
+    except Exception as e:
+        _redis_failed(f"Redis write failed for {key}", e)
+
+
+# Delete the lock only if it still holds our token (it may have expired and
+# been taken by another worker meanwhile)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+@contextmanager
+def _shared_refresh_lock(key: str, ttl: int):
+    """
+    Yield True if this worker should run the refresh for `key`, False if
+    another worker already holds the lock (SET NX with an expiry, so a crashed
+    holder cannot wedge it). Always True without Redis.
+    """
+    client = _get_redis()
+    lock_key = f"lock:{key}"
+    token = uuid.uuid4().hex.encode()
+    acquired = True
+    held = False
+    if client is not None:
+        try:
+            acquired = held = bool(client.set(lock_key, token, nx=True, ex=ttl))
+        except Exception as e:
+            _redis_failed(f"Redis lock failed for {key}", e)
+    try:
+        yield acquired
+    finally:
+        if held:
+            try:
+                client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+            except Exception:
+                pass
+
+
+# Shared pool for the per-ticker news fan-out (reused across requests instead of
+# spinning up 20 fresh threads on every cache miss)
+_news_pool = ThreadPoolExecutor(max_workers=20)
+
+
+# Single worker so overlapping cron/manual triggers run one daily report at a time
+_report_pool = ThreadPoolExecutor(max_workers=1)
+DAILY_REPORT_TIMEOUT = 300  # 5 minute timeout
+
+# Optional process pool for scoring very large batches, off by default.
+# In-process TextBlob scores ~1000 texts in under 100ms, while each spawned
+# worker re-imports this module (~1s cold, and its own RSS), and pool results
+# bypass the _score_text memo. Only worth enabling on big multi-core hosts.
+SENTIMENT_PROCESSES = int(os.getenv("SENTIMENT_PROCESSES", "0") or 0)
+SENTIMENT_POOL_MIN_BATCH = 5000  # distinct texts; below this the pool's overhead dominates
+_sentiment_pool: Optional[ProcessPoolExecutor] = None
+_sentiment_pool_lock = threading.Lock()
+
+
+def _get_sentiment_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared scoring pool, or None unless SENTIMENT_PROCESSES >= 2."""
+    global _sentiment_pool
+    if SENTIMENT_PROCESSES < 2:
         return None
-    return data
+    with _sentiment_pool_lock:
+        if _sentiment_pool is None:
+            _sentiment_pool = ProcessPoolExecutor(
+                max_workers=SENTIMENT_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _sentiment_pool
 
 
-def _set_cache(key: str, data: any) -> None:
-    """Store data in cache with current timestamp."""
-    _cache[key] = (data, time.time())
+def _discard_sentiment_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next large batch starts a fresh one."""
+    global _sentiment_pool
+    with _sentiment_pool_lock:
+        if _sentiment_pool is pool:
+            _sentiment_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
 
 
-app = FastAPI(title="US & Indian Market Investment Recommendation API (Yahoo Finance)")
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """
+    Start the background price prefetch (if enabled) and release the shared
+    worker pools when the server shuts down. The pools are replaced with
+    fresh (thread-less until used) ones, so a later lifespan in the same
+    process (uvicorn --reload, several TestClients) still has working pools.
+    """
+    global _news_pool, _report_pool
+    prefetch_task = asyncio.create_task(_refresh_prices_forever()) if PRICE_PREFETCH else None
+    yield
+    if prefetch_task is not None:
+        prefetch_task.cancel()
+    news_pool, _news_pool = _news_pool, ThreadPoolExecutor(max_workers=20)
+    report_pool, _report_pool = _report_pool, ThreadPoolExecutor(max_workers=1)
+    news_pool.shutdown(wait=False, cancel_futures=True)
+    report_pool.shutdown(wait=False, cancel_futures=True)
+    if _sentiment_pool is not None:
+        _discard_sentiment_pool(_sentiment_pool)
+
+
+app = FastAPI(
+    title="US & Indian Market Investment Recommendation API (Yahoo Finance)",
+    lifespan=_lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -49,55 +292,135 @@ app.add_middleware(
 )
 
 
-def _fetch_news_for_ticker(ticker: str) -> List[Dict]:
+def _fetch_news_for_ticker(ticker: str) -> Optional[List[Dict]]:
     """
     Fetch latest news for a single ticker using yfinance.
     yfinance v0.2+ uses nested structure: item['content']['title'], item['content']['summary']
+    Returns None if the fetch failed (as opposed to [] for no articles), so
+    callers don't cache the failure.
     """
     try:
-        # Suppress yfinance warnings and use quiet mode
-        import warnings
-        warnings.filterwarnings("ignore", category=FutureWarning)
-        
-        t = yf.Ticker(ticker)
         # yfinance .news is a list of dicts with 'id' and 'content' keys
-        # Use quiet=True to suppress messages
-        news_items = t.news or []
-
-        cleaned: List[Dict] = []
-        for item in news_items:
-            content = item.get("content", {})
-            provider = content.get("provider", {})
-            canonical = content.get("canonicalUrl", {})
-            
-            cleaned.append(
-                {
-                    "ticker": ticker,
-                    "title": content.get("title", ""),
-                    "summary": content.get("summary", "") or content.get("description", ""),
-                    "publisher": provider.get("displayName", "") if isinstance(provider, dict) else "",
-                    "link": canonical.get("url", "") if isinstance(canonical, dict) else content.get("link", ""),
-                }
-            )
-        return cleaned
+        news_items = with_retry(lambda: get_ticker(ticker).news) or []
+        if not news_items:
+            return []
+
+        # Pick the parser once per response based on the payload layout
+        if "content" in news_items[0]:
+            return _parse_yf_news(ticker, news_items)
+        return _parse_yf_news_legacy(ticker, news_items)
     except Exception as e:
         print(f"Error fetching news for {ticker}: {e}")
-        return []
+        return None
+
+
+def _parse_yf_news(ticker: str, news_items: List[Dict]) -> List[Dict]:
+    """Parse the nested yfinance v0.2+ layout: item['content'][...]."""
+    cleaned: List[Dict] = []
+    for item in news_items:
+        content = item.get("content") or {}
+        provider = content.get("provider") or {}
+        canonical = content.get("canonicalUrl") or {}
+        cleaned.append(
+            {
+                "ticker": ticker,
+                "title": content.get("title", ""),
+                "summary": content.get("summary", "") or content.get("description", ""),
+                "publisher": provider.get("displayName", ""),
+                "link": canonical.get("url") or content.get("link", ""),
+            }
+        )
+    return cleaned
+
+
+def _parse_yf_news_legacy(ticker: str, news_items: List[Dict]) -> List[Dict]:
+    """Parse the flat layout returned by older yfinance releases."""
+    return [
+        {
+            "ticker": ticker,
+            "title": item.get("title", ""),
+            "summary": item.get("summary", ""),
+            "publisher": item.get("publisher", ""),
+            "link": item.get("link", ""),
+        }
+        for item in news_items
+    ]
+
+
+# Sentiment backend: "textblob" (default) or "vader" (much faster lexicon lookup,
+# but polarity-only and on a different scale than the Buy/Sell thresholds below)
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "textblob").strip().lower()
+_vader = None
+if SENTIMENT_BACKEND == "vader":
+    try:
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+        _vader = SentimentIntensityAnalyzer()
+    except ImportError:
+        print("vaderSentiment not installed; falling back to TextBlob")
+if _vader is None:
+    # TextBlob parses its en-sentiment.xml lexicon on the first .sentiment call;
+    # do it at import so the first request (or pool worker) doesn't pay for it.
+    try:
+        TextBlob("warmup").sentiment
+    except Exception as e:
+        print(f"TextBlob warmup failed: {e}")
 
 
 def _analyze_sentiment(text: str) -> Dict[str, float]:
     """
     Simple TextBlob polarity / subjectivity helper.
+    With SENTIMENT_BACKEND=vader, polarity is VADER's compound score and
+    subjectivity is reported as 0.0.
     Returns 0.0 for empty/whitespace-only text.
     """
     text = (text or "").strip()
     if not text:
         return {"polarity": 0.0, "subjectivity": 0.0}
+    polarity, subjectivity = _score_text(text)
+    return {"polarity": polarity, "subjectivity": subjectivity}
+
+
+@lru_cache(maxsize=4096)
+def _score_text(text: str) -> Tuple[float, float]:
+    """
+    Memoized (polarity, subjectivity) for a stripped, non-empty text.
+    Syndicated headlines repeat across tickers and refreshes, so identical
+    texts are only run through the analyzer once.
+    """
+    if _vader is not None:
+        scores = _vader.polarity_scores(text)
+        return float(scores["compound"]), 0.0
     blob = TextBlob(text)
-    return {
-        "polarity": float(blob.sentiment.polarity),
-        "subjectivity": float(blob.sentiment.subjectivity),
-    }
+    return float(blob.sentiment.polarity), float(blob.sentiment.subjectivity)
+
+
+def _analyze_sentiment_batch(texts: List[str]) -> List[Dict[str, float]]:
+    """
+    Run _analyze_sentiment over a batch of texts.
+    Syndicated stories show up under several tickers, so each distinct text
+    is scored once and the result is copied to its duplicates.
+    With SENTIMENT_PROCESSES set, very large batches are spread across
+    worker processes; otherwise everything is scored in-process.
+    """
+    unique = list(dict.fromkeys(texts))
+    scores = None
+    pool = _get_sentiment_pool() if len(unique) >= SENTIMENT_POOL_MIN_BATCH else None
+    if pool is not None:
+        try:
+            scores = list(pool.map(_analyze_sentiment, unique, chunksize=32))
+        except Exception as e:
+            print(f"Sentiment process pool failed, scoring in-process: {e}")
+            _discard_sentiment_pool(pool)
+    if scores is None:
+        scores = [_analyze_sentiment(text) for text in unique]
+    by_text = dict(zip(unique, scores))
+    return [dict(by_text[text]) for text in texts]
+
+
+# Tunable thresholds: avg polarity >= BUY_THRESHOLD is Buy, <= SELL_THRESHOLD is Sell
+BUY_THRESHOLD = 0.10
+SELL_THRESHOLD = -0.05
+_REC_LABELS = ("Sell", "Hold", "Buy")
 
 
 def _recommendation_from_score(score: float) -> str:
@@ -105,17 +428,26 @@ def _recommendation_from_score(score: float) -> str:
     Turn an average polarity score into Buy / Hold / Sell.
     Tunable thresholds.
     """
-    if score >= 0.10:
+    if score >= BUY_THRESHOLD:
         return "Buy"
-    if score <= -0.05:
+    if score <= SELL_THRESHOLD:
         return "Sell"
     return "Hold"
 
 
+def _recommendations_from_scores(scores: np.ndarray) -> List[str]:
+    """Vectorized _recommendation_from_score over an array of average polarities."""
+    # Both thresholds are inclusive on the signal side, so count crossings
+    # explicitly rather than with a single searchsorted side
+    label_idx = (scores > SELL_THRESHOLD).astype(np.intp) + (scores >= BUY_THRESHOLD)
+    return [_REC_LABELS[i] for i in label_idx.tolist()]
+
+
 @app.get("/price_chart")
 def price_chart(ticker: str, include_ohlc: bool = False):
     """
     Get price chart data for a ticker.
+    Price history is cached for 1 hour per ticker.
     
     Args:
         ticker: Stock symbol
@@ -124,193 +456,586 @@ def price_chart(ticker: str, include_ohlc: bool = False):
     Returns:
         Dict with dates, closes, and optionally OHLC + volume data
     """
-    if ticker not in TICKERS:
+    if ticker not in _TICKER_SET:
         raise HTTPException(status_code=400, detail="Unsupported ticker")
 
-    try:
-        import warnings
-        warnings.filterwarnings("ignore", category=FutureWarning)
-        warnings.filterwarnings("ignore", category=UserWarning)
-        
-        # Create fresh Ticker object to avoid caching issues
-        stock = yf.Ticker(ticker)
-        
-        # Fetch with timeout and error handling
+    cache_key = _history_cache_key(ticker)
+    data = _get_cache(cache_key)
+    if data is None:
         try:
-            data = stock.history(period="1mo", interval="1d", timeout=10, quiet=True)
-        except Exception as e:
-            print(f"Error fetching history for {ticker}: {e}")
-            raise HTTPException(status_code=500, detail=f"Error fetching price data: {str(e)}")
+            # Create fresh Ticker object to avoid caching issues
+            stock = get_ticker(ticker)
+            
+            # Fetch with timeout and error handling
+            try:
+                data = with_retry(lambda: stock.history(period="1mo", interval="1d", timeout=10, quiet=True))
+            except Exception as e:
+                print(f"Error fetching history for {ticker}: {e}")
+                raise HTTPException(status_code=500, detail=f"Error fetching price data: {str(e)}")
 
-    except HTTPException:
-        raise
-    except Exception as exc:  # pragma: no cover - defensive
-        print(f"Exception in price_chart for {ticker}: {exc}")
-        raise HTTPException(status_code=500, detail=f"Error fetching price data: {str(exc)}")
+        except HTTPException:
+            raise
+        except Exception as exc:  # pragma: no cover - defensive
+            print(f"Exception in price_chart for {ticker}: {exc}")
+            raise HTTPException(status_code=500, detail=f"Error fetching price data: {str(exc)}")
 
-    if data.empty or len(data) == 0:
-        print(f"Warning: Empty data returned for {ticker}")
-        raise HTTPException(status_code=404, detail=f"No price data found for {ticker}. The stock may be delisted or data unavailable.")
+        if data.empty or len(data) == 0:
+            print(f"Warning: Empty data returned for {ticker}")
+            raise HTTPException(status_code=404, detail=f"No price data found for {ticker}. The stock may be delisted or data unavailable.")
 
-    dates: List[str] = [d.strftime("%Y-%m-%d") for d in data.index.to_pydatetime()]
-    closes: List[float] = [float(c) for c in data["Close"].tolist()]
+        # Daily bars over a month barely move intraday; keep them for an hour
+        _set_cache(cache_key, data, ttl=PRICE_CACHE_TTL)
+
+    # Format/convert in pandas rather than per-row Python datetime/float objects
+    dates: List[str] = data.index.strftime("%Y-%m-%d").tolist()
+    closes: List[float] = data["Close"].to_numpy(dtype=np.float64).tolist()
     
     result = {"ticker": ticker, "dates": dates, "closes": closes}
     
     # Include OHLC and volume if requested
     if include_ohlc:
-        result["opens"] = [float(o) for o in data["Open"].tolist()]
-        result["highs"] = [float(h) for h in data["High"].tolist()]
-        result["lows"] = [float(l) for l in data["Low"].tolist()]
-        result["volumes"] = [int(v) for v in data["Volume"].tolist()]
+        result["opens"] = data["Open"].to_numpy(dtype=np.float64).tolist()
+        result["highs"] = data["High"].to_numpy(dtype=np.float64).tolist()
+        result["lows"] = data["Low"].to_numpy(dtype=np.float64).tolist()
+        result["volumes"] = data["Volume"].astype("int64").tolist()
     
     return result
 
 
+def _history_cache_key(ticker: str) -> str:
+    return _cache_key("history", ticker, "1mo")
+
+
+def _cached_json_fetch(key: str, ttl: int, fetch) -> Dict:
+    """
+    Look up a JSON-safe dict in this worker's cache, then the shared cache,
+    then call `fetch()`. Empty results (fetch failures) are not cached.
+    """
+    data = _get_cache(key)
+    if data is not None:
+        return data
+    entry = _get_shared_many([key])[0]
+    if entry is not None:
+        _set_cache(key, entry[0], ttl=entry[1])
+        return entry[0]
+    data = fetch()
+    if data:
+        _set_cache(key, data, ttl=ttl)
+        _set_shared(key, data, ttl=ttl)
+    return data
+
+
+def _technical_indicators(ticker: str, period: str = "6mo") -> Dict:
+    """get_technical_indicators, cached for TECHNICAL_CACHE_TTL."""
+    from backend.mcp_integration import get_technical_indicators
+
+    return _cached_json_fetch(
+        _cache_key("technical", ticker, period),
+        TECHNICAL_CACHE_TTL,
+        lambda: get_technical_indicators(ticker, period=period),
+    )
+
+
+def _fundamental_snapshot(ticker: str) -> Dict:
+    """get_fundamental_snapshot, cached for FUNDAMENTAL_CACHE_TTL."""
+    from backend.mcp_integration import get_fundamental_snapshot
+
+    return _cached_json_fetch(
+        _cache_key("fundamental", ticker), FUNDAMENTAL_CACHE_TTL, lambda: get_fundamental_snapshot(ticker)
+    )
+
+
+def _prefetch_price_history() -> None:
+    """
+    Load 1-month daily bars for every ticker with one batched yf.download and
+    seed the per-ticker history cache that /price_chart reads.
+    """
+    from backend.mcp_integration import get_bulk_history
+
+    history = get_bulk_history(TICKERS, period="1mo")
+    for ticker, data in history.items():
+        _set_cache(_history_cache_key(ticker), data, ttl=PRICE_CACHE_TTL)
+    loaded = len(history)
+    print(f"Price prefetch: {loaded}/{len(TICKERS)} tickers cached")
+
+
+async def _refresh_prices_forever() -> None:
+    while True:
+        try:
+            await run_in_threadpool(_prefetch_price_history)
+        except Exception as e:
+            # Keep the loop alive; /price_chart falls back to per-ticker fetches
+            print(f"Price prefetch failed: {e}")
+        await asyncio.sleep(PRICE_PREFETCH_INTERVAL)
+
+
+# Serialized body + ETag for the large cached payloads, keyed by endpoint.
+# Reused for as long as the endpoint keeps returning the same cached object.
+_response_memo: Dict[str, tuple] = {}  # name -> (payload, body, etag)
+
+
+def _cached_json_response(request: Request, name: str, payload) -> Response:
+    """
+    JSON response for a cached payload with ETag and Cache-Control headers.
+    The payload is serialized and hashed once per cache refresh, and clients
+    (or a CDN) holding the current ETag get a bodyless 304.
+    """
+    memo = _response_memo.get(name)
+    if memo is None or memo[0] is not payload:
+        body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        memo = (payload, body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+        _response_memo[name] = memo
+    headers = {"ETag": memo[2], "Cache-Control": f"public, max-age={CACHE_TTL}"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if memo[2] in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=memo[1], media_type="application/json", headers=headers)
+
+
 @app.get("/news")
-def news():
+async def news(request: Request):
     """
     Raw news feed for all tickers.
     Cached for 5 minutes to reduce API calls.
+    Warm hits are served straight from the event loop; a cache miss runs the
+    blocking fan-out in the threadpool.
+    """
+    cached = _get_cache(NEWS_CACHE_KEY)
+    if cached is None:
+        cached = await run_in_threadpool(_load_news)
+    return _cached_json_response(request, "news", cached)
+
+
+@app.get("/news/stream")
+async def news_stream():
+    """
+    Same articles as /news, streamed as NDJSON (one JSON object per line).
+    On a cache miss each ticker's articles are written as soon as its fetch
+    completes, so the first bytes arrive after the fastest upstream instead
+    of the slowest. Lines are in completion order, not TICKERS order.
+    """
+    return StreamingResponse(_ndjson_news(), media_type="application/x-ndjson")
+
+
+async def _fetch_news_async(ticker: str) -> Optional[List[Dict]]:
+    """Run one ticker's fetch on the shared news pool without blocking the loop."""
+    try:
+        return await asyncio.wrap_future(_news_pool.submit(_fetch_news_for_ticker, ticker))
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        print(f"Error fetching news for {ticker}: {e}")
+        return None
+
+
+async def _ndjson_news():
+    cached = _get_cache(NEWS_CACHE_KEY)
+    if cached is not None:
+        for item in cached:
+            yield orjson.dumps(item) + b"\n"
+        return
+
+    # Cache lookups and writes below may hit Redis; keep them off the event loop
+    per_ticker, stale = await run_in_threadpool(_cached_news_by_ticker)
+    for items in per_ticker.values():
+        for item in items:
+            yield orjson.dumps(item) + b"\n"
+
+    async def _fetch(ticker: str):
+        return ticker, await _fetch_news_async(ticker)
+
+    # One deadline for the whole fan-out, as in _refresh_news; it includes
+    # time spent queued for a slot on the shared pool
+    tasks = [asyncio.ensure_future(_fetch(t)) for t in stale]
+    skipped = len(stale)
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=NEWS_FETCH_TIMEOUT):
+            ticker, news_items = await next_done
+            if news_items is None:
+                continue
+            skipped -= 1
+            per_ticker[ticker] = news_items
+            await run_in_threadpool(_store_ticker_news, ticker, news_items)
+            for item in news_items:
+                yield orjson.dumps(item) + b"\n"
+    except asyncio.TimeoutError:
+        print(f"News stream timed out after {NEWS_FETCH_TIMEOUT}s")
+    finally:
+        for task in tasks:
+            task.cancel()  # drop queued fetches (also when the client disconnects)
+
+    all_news = _assemble_news(per_ticker)
+    if skipped:
+        # A partial list must not become news_all for every endpoint; the
+        # tickers that did arrive are already cached individually
+        print(f"News stream complete: {len(all_news)} articles, {skipped} tickers missing; not publishing")
+        return
+    print(f"News stream complete: {len(all_news)} articles")
+    await run_in_threadpool(_publish_news, all_news)
+
+
+def _news_cache_key(ticker: str) -> str:
+    return _cache_key("news", ticker)
+
+
+def _cached_news_by_ticker() -> Tuple[Dict[str, List[Dict]], List[str]]:
+    """Split TICKERS into per-ticker cache hits and the stale tickers to refetch."""
+    per_ticker: Dict[str, List[Dict]] = {}
+    missing: List[str] = []
+    for ticker in TICKERS:
+        items = _get_cache(_news_cache_key(ticker))
+        if items is None:
+            missing.append(ticker)
+        else:
+            per_ticker[ticker] = items
+
+    # Tickers another worker refreshed recently come from the shared cache
+    stale: List[str] = []
+    keys = [_news_cache_key(ticker) for ticker in missing]
+    for ticker, key, entry in zip(missing, keys, _get_shared_many(keys)):
+        if entry is None:
+            stale.append(ticker)
+        else:
+            per_ticker[ticker] = entry[0]
+            _set_cache(key, entry[0], ttl=entry[1])
+    return per_ticker, stale
+
+
+def _store_ticker_news(ticker: str, news_items: List[Dict]) -> None:
+    _set_cache(_news_cache_key(ticker), news_items)
+    _set_shared(_news_cache_key(ticker), news_items)
+
+
+def _assemble_news(per_ticker: Dict[str, List[Dict]]) -> List[Dict]:
+    """Flatten per-ticker results in TICKERS order."""
+    return [item for ticker in TICKERS for item in per_ticker.get(ticker, ())]
+
+
+def _load_news() -> List[Dict]:
+    """
+    Fetch news for all tickers (blocking).
+    Cached for 5 minutes to reduce API calls, both as a whole and per ticker:
+    a rebuild only refetches tickers whose own entry has expired or whose
+    last fetch failed or timed out.
     Uses concurrent fetching to speed up requests (20 workers).
     """
-    cache_key = "news_all"
-    cached = _get_cache(cache_key)
+    cached = _get_cache(NEWS_CACHE_KEY)
     if cached is not None:
         return cached
-    
-    all_news: List[Dict] = []
-    total_tickers = len(TICKERS)
+
+    with _refresh_lock(NEWS_CACHE_KEY):
+        # Another thread may have refreshed while we waited for the lock
+        cached = _get_cache(NEWS_CACHE_KEY)
+        if cached is not None:
+            return cached
+        cached = _adopt_shared_news()
+        if cached is not None:
+            return cached
+
+        with _shared_refresh_lock(NEWS_CACHE_KEY, ttl=NEWS_FETCH_TIMEOUT + 30) as acquired:
+            if not acquired:
+                # Another worker is already fetching; wait for its result
+                deadline = time.time() + NEWS_FETCH_TIMEOUT + 5
+                while time.time() < deadline:
+                    time.sleep(0.5)
+                    cached = _adopt_shared_news()
+                    if cached is not None:
+                        return cached
+                print("Timed out waiting for another worker's news refresh; fetching here")
+            return _refresh_news()
+
+
+def _refresh_news() -> List[Dict]:
+    per_ticker, stale = _cached_news_by_ticker()
+    total_tickers = len(stale)
     completed = 0
     
-    # Use ThreadPoolExecutor for concurrent fetching (max 20 workers to avoid overwhelming yfinance)
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        # Submit all ticker fetches
-        future_to_ticker = {executor.submit(_fetch_news_for_ticker, ticker): ticker for ticker in TICKERS}
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_ticker):
+    # Fan out over the shared pool (max 20 workers to avoid overwhelming yfinance)
+    future_to_ticker = {_news_pool.submit(_fetch_news_for_ticker, ticker): ticker for ticker in stale}
+    
+    # Collect results as they complete. as_completed only yields finished
+    # futures, so a per-result timeout never fires; bound the whole fan-out
+    # instead so a few hung yfinance calls can't stall the endpoint.
+    try:
+        for future in as_completed(future_to_ticker, timeout=NEWS_FETCH_TIMEOUT):
             ticker = future_to_ticker[future]
             completed += 1
             try:
-                news_items = future.result(timeout=5)  # 5 second timeout per ticker
-                all_news.extend(news_items)
+                news_items = future.result()
+                if news_items is None:
+                    continue  # failed; not cached, so the next rebuild retries it
+                per_ticker[ticker] = news_items
+                _store_ticker_news(ticker, news_items)
                 if completed % 10 == 0:  # Log progress every 10 tickers
                     print(f"News fetch progress: {completed}/{total_tickers} tickers processed")
             except Exception as e:
                 # If one ticker fails, continue with others
                 print(f"Error fetching news for {ticker}: {e}")
                 continue
+    except FuturesTimeoutError:
+        skipped = [t for f, t in future_to_ticker.items() if not f.done()]
+        for f in future_to_ticker:
+            f.cancel()  # drop queued fetches; running ones finish in the background
+        print(f"News fetch timed out after {NEWS_FETCH_TIMEOUT}s; skipped {len(skipped)} tickers")
     
-    print(f"News fetch complete: {len(all_news)} articles from {completed} tickers")
-    _set_cache(cache_key, all_news)
+    all_news = _assemble_news(per_ticker)
+    print(
+        f"News fetch complete: {len(all_news)} articles "
+        f"({completed} tickers fetched, {len(TICKERS) - total_tickers} from cache)"
+    )
+    _publish_news(all_news)
     return all_news
 
 
-@app.get("/sentiment")
-def sentiment():
+# Bumped every time news_all is replaced; derived caches (sentiment snapshot,
+# recommendations) record the generation they were built from and are reused
+# only while it still matches.
+_news_gen = 0
+
+
+def _publish_news(all_news: List[Dict], ttl: int = CACHE_TTL, share: bool = True) -> None:
+    global _news_gen
+    with _cache_lock:
+        _set_cache(NEWS_CACHE_KEY, all_news, ttl=ttl)
+        _news_gen += 1
+    if share:
+        _set_shared(NEWS_CACHE_KEY, all_news, ttl=ttl)
+
+
+def _adopt_shared_news() -> Optional[List[Dict]]:
+    """Take over news_all from the shared cache if another worker published it."""
+    entry = _get_shared_many([NEWS_CACHE_KEY])[0]
+    if entry is None:
+        return None
+    _publish_news(entry[0], ttl=entry[1], share=False)
+    return entry[0]
+
+
+def _sentiment_snapshot() -> Dict:
     """
-    Per‑article sentiment for all news.
-    Analyzes both title and summary together for better sentiment detection.
-    Cached for 5 minutes to reduce computation.
+    Score every article once and build both views of the result in that pass:
+    per-article rows for /sentiment and per-ticker polarity_sum / news_count
+    arrays (indexed like TICKERS) for /recommendations and /compare.
+    Cached for 5 minutes, and only reused while the news it was scored from
+    is still the current news_all generation.
     """
-    cache_key = "sentiment_all"
-    cached = _get_cache(cache_key)
+    cached = _cached_snapshot()
     if cached is not None:
         return cached
-    
-    items = news()
+    with _refresh_lock(SENTIMENT_CACHE_KEY):
+        cached = _cached_snapshot()
+        if cached is not None:
+            return cached
+        return _compute_sentiment_snapshot()
+
+
+def _article_text(item: Dict) -> str:
+    # Combine title + summary for richer sentiment analysis
+    return f"{item.get('title', '')} {item.get('summary', '')}".strip()
+
+
+def _news_with_generation() -> Tuple[List[Dict], int]:
+    """
+    news_all together with the generation it was published as. If it was
+    replaced (or expired) between loading and reading the generation, -1 is
+    returned so a snapshot built from it is never taken as current.
+    """
+    items = _load_news()
+    with _cache_lock:
+        if _get_cache(NEWS_CACHE_KEY) is items:
+            return items, _news_gen
+    return items, -1
+
+
+def _compute_sentiment_snapshot() -> Dict:
+    items, generation = _news_with_generation()
+    # Combine title + summary for richer sentiment analysis
+    texts = [_article_text(n) for n in items]
+    scores = _analyze_sentiment_batch(texts)
     results: List[Dict] = []
-    for n in items:
+    for n, score in zip(items, scores):
         title = n.get("title", "")
         summary = n.get("summary", "")
-        # Combine title + summary for richer sentiment analysis
-        combined_text = f"{title} {summary}".strip()
-        scores = _analyze_sentiment(combined_text)
         results.append(
             {
                 "ticker": n.get("ticker"),
                 "title": title,
                 "summary": summary or title,  # Fallback to title if no summary
-                "polarity": scores["polarity"],
-                "subjectivity": scores["subjectivity"],
+                "polarity": score["polarity"],
+                "subjectivity": score["subjectivity"],
             }
         )
     
-    _set_cache(cache_key, results)
-    return results
+    # Group-by-ticker sums and counts in one bincount pass each
+    idx = np.fromiter((_TICKER_INDEX[n["ticker"]] for n in items), dtype=np.intp, count=len(items))
+    pol = np.fromiter((score["polarity"] for score in scores), dtype=np.float64, count=len(items))
+    snapshot = {
+        "articles": results,
+        "polarity_sum": np.bincount(idx, weights=pol, minlength=len(TICKERS)),
+        "news_count": np.bincount(idx, minlength=len(TICKERS)),
+        "generation": generation,
+    }
+    _set_cache(SENTIMENT_CACHE_KEY, snapshot)
+    return snapshot
+
+
+def _cached_snapshot() -> Optional[Dict]:
+    cached = _get_cache(SENTIMENT_CACHE_KEY)
+    if cached is not None and cached["generation"] == _news_gen:
+        return cached
+    return None
+
+
+async def _sentiment_snapshot_async() -> Dict:
+    """Cached snapshot without a thread hop; compute it in the threadpool on a miss."""
+    cached = _cached_snapshot()
+    if cached is not None:
+        return cached
+    return await run_in_threadpool(_sentiment_snapshot)
+
+
+@app.get("/sentiment")
+async def sentiment(request: Request):
+    """
+    Per‑article sentiment for all news.
+    Analyzes both title and summary together for better sentiment detection.
+    Cached for 5 minutes to reduce computation.
+    """
+    return _cached_json_response(request, "sentiment", (await _sentiment_snapshot_async())["articles"])
+
+
+@app.get("/sentiment/stream")
+async def sentiment_stream():
+    """Same rows as /sentiment, streamed as NDJSON (one JSON object per line)."""
+    articles = (await _sentiment_snapshot_async())["articles"]
+
+    async def _rows():
+        for row in articles:
+            yield orjson.dumps(row) + b"\n"
+
+    return StreamingResponse(_rows(), media_type="application/x-ndjson")
 
 
 @app.get("/recommendations")
-def recommendations():
+async def recommendations(
+    request: Request,
+    market: Optional[str] = None,
+    recommendation: Optional[str] = None,
+    q: Optional[str] = None,
+):
     """
     Aggregate sentiment into per‑ticker recommendations.
     Enhanced with MCP technical indicators and fundamentals when available.
     Returns: ticker, avg_polarity, recommendation, confidence, factors, news_count.
+    
+    Optional filters (applied server-side so only matching rows are sent):
+        market: Comma-separated markets, e.g. "US,Indian"
+        recommendation: Comma-separated labels, e.g. "Buy,Hold"
+        q: Case-insensitive ticker substring
     """
-    sentiments = sentiment()
-    if not sentiments:
-        return []
+    snapshot = await _sentiment_snapshot_async()
+    cached = _get_cache(RECOMMENDATIONS_CACHE_KEY)
+    if cached is not None and cached[0] == snapshot["generation"]:
+        rows = cached[1]
+    else:
+        # A rebuild may bulk-fetch MCP data, so keep it off the event loop
+        rows = await run_in_threadpool(_build_recommendations, snapshot)
+    if market or recommendation or q:
+        return _filter_recommendations(rows, market, recommendation, q)
+    return _cached_json_response(request, "recommendations", rows)
+
+
+def _filter_recommendations(
+    rows: List[Dict], market: Optional[str], recommendation: Optional[str], q: Optional[str]
+) -> List[Dict]:
+    """Rows matching every given filter (see /recommendations)."""
+    markets = {m.strip() for m in market.split(",") if m.strip()} if market else None
+    labels = {r.strip() for r in recommendation.split(",") if r.strip()} if recommendation else None
+    needle = q.strip().upper() if q else ""
+    return [
+        row for row in rows
+        if (not markets or ("Indian" if row["ticker"].endswith((".NS", ".BO")) else "US") in markets)
+        and (not labels or row["recommendation"] in labels)
+        and needle in row["ticker"].upper()
+    ]
+
+
+def _build_recommendations(snapshot: Optional[Dict] = None) -> List[Dict]:
+    """
+    Turn per-ticker sentiment sums into recommendation rows (blocking on a miss).
+    Rows are cached against the snapshot's news generation.
+    """
+    snapshot = snapshot or _sentiment_snapshot()
+    with _refresh_lock(RECOMMENDATIONS_CACHE_KEY):
+        cached = _get_cache(RECOMMENDATIONS_CACHE_KEY)
+        if cached is not None and cached[0] == snapshot["generation"]:
+            return cached[1]
+        return _compute_recommendations(snapshot)
+
+
+def _compute_recommendations(snapshot: Dict) -> List[Dict]:
+    counts = snapshot["news_count"]
+    averages = snapshot["polarity_sum"] / np.maximum(counts, 1)
+    rows = np.flatnonzero(counts)
+    base_recs = _recommendations_from_scores(averages[rows])
+
+    # Fetch MCP data for every ticker up front (concurrently) rather than one
+    # ticker at a time inside the loop
+    technicals: Dict[str, Dict] = {}
+    fundamentals: Dict[str, Dict] = {}
+    if MCP_ENRICH_RECOMMENDATIONS:
+        from backend.ticker_bundle import fundamental_snapshot, get_bundles, technical_indicators
 
-    by_ticker: Dict[str, List[float]] = {}
-    for item in sentiments:
-        t = item["ticker"]
-        by_ticker.setdefault(t, []).append(float(item["polarity"]))
+        # History and info for every ticker in one go, reused for BUNDLE_TTL
+        # across news refreshes
+        bundles = get_bundles([TICKERS[i] for i in rows])
+        technicals = {ticker: technical_indicators(bundle) for ticker, bundle in bundles.items()}
+        fundamentals = {ticker: fundamental_snapshot(bundle) for ticker, bundle in bundles.items()}
 
+    # Walk TICKERS order so rows come out in the frontend's stable order
     output: List[Dict] = []
-    for ticker, scores in by_ticker.items():
-        if not scores:
-            continue
-        avg_sentiment = sum(scores) / len(scores)
-        news_count = len(scores)  # Count of news articles analyzed
-        base_rec = _recommendation_from_score(avg_sentiment)
+    for i, base_rec in zip(rows, base_recs):
+        ticker = TICKERS[i]
+        news_count = int(counts[i])  # articles analyzed
+        avg_sentiment = float(averages[i])
         
         # Try to enhance with MCP data (may not work for all Indian stocks)
-        enhanced = _enhance_recommendation_with_mcp(ticker, avg_sentiment, base_rec)
+        enhanced = _enhance_recommendation_with_mcp(
+            ticker, avg_sentiment, base_rec,
+            technicals=technicals.get(ticker), fundamentals=fundamentals.get(ticker),
+        )
         # Add news_count to the enhanced recommendation
         enhanced["news_count"] = news_count
         
         output.append(enhanced)
 
-    # Stable ordering like the frontend's list
-    ticker_to_row = {row["ticker"]: row for row in output}
-    ordered: List[Dict] = []
-    for t in TICKERS:
-        row = ticker_to_row.get(t)
-        if row:
-            ordered.append(row)
-
-    return ordered
+    _set_cache(RECOMMENDATIONS_CACHE_KEY, (snapshot["generation"], output))
+    return output
 
 
-def _enhance_recommendation_with_mcp(ticker: str, sentiment_score: float, base_rec: str) -> Dict:
+def _enhance_recommendation_with_mcp(
+    ticker: str,
+    sentiment_score: float,
+    base_rec: str,
+    technicals: Optional[Dict] = None,
+    fundamentals: Optional[Dict] = None,
+) -> Dict:
     """
     Enhance recommendation using MCP tools (technical indicators, fundamentals).
     Falls back gracefully if MCP data unavailable.
+    No network calls here: callers prefetch technicals/fundamentals in bulk.
     
-    NOTE: Technical indicators are currently disabled to avoid timeouts.
-    They can be enabled per-ticker via a separate endpoint if needed.
+    NOTE: Prefetching is off by default to avoid timeouts (see
+    MCP_ENRICH_RECOMMENDATIONS); per-ticker data is available via
+    /technical and /fundamental.
     """
-    from backend.mcp_integration import get_technical_indicators, get_fundamental_snapshot
-    
     factors = {"sentiment": sentiment_score}
     confidence = 0.5  # Base confidence from sentiment only
     
-    # Skip technical indicators for now to avoid timeouts (109 stocks × API calls = too slow)
-    # Technical indicators can be fetched on-demand via a separate endpoint if needed
-    # Only fetch for US stocks if we want to enable it selectively
-    # try:
-    #     technicals = get_technical_indicators(ticker, period="6mo")
-    #     ...
-    # except Exception:
-    #     pass
-    
-    # Skip fundamentals for now to avoid timeouts
-    # try:
-    #     fundamentals = get_fundamental_snapshot(ticker)
-    #     ...
-    # except Exception:
-    #     pass
+    if technicals:
+        factors["technical"] = technicals
+    if fundamentals:
+        factors["fundamental"] = fundamentals
     
     # Final recommendation: combine sentiment + technicals
     final_rec = base_rec
@@ -336,7 +1061,7 @@ def _enhance_recommendation_with_mcp(ticker: str, sentiment_score: float, base_r
 
 
 @app.get("/")
-def root():
+async def root():
     return {
         "status": "ok",
         "message": "US & Indian Market Investment Recommendation API (all data via Yahoo Finance)",
@@ -344,12 +1069,15 @@ def root():
 
 
 @app.get("/health")
-def health():
+async def health():
     """
     Health check endpoint for Render deployment.
-    Returns immediately without any data fetching.
+    Returns immediately without any data fetching; includes this worker's
+    in-memory cache hit/miss counters.
     """
-    return {"status": "healthy", "service": "investment-recommendation-api"}
+    with _cache_lock:
+        cache_stats = dict(_cache_stats)
+    return {"status": "healthy", "service": "investment-recommendation-api", "cache": cache_stats}
 
 
 @app.get("/technical/{ticker}")
@@ -364,13 +1092,11 @@ def get_technical_analysis(ticker: str):
     Returns:
         Dict with technical indicators: {rsi, sma: {20, 50, 200}, ema: {12, 26}, current_price}
     """
-    if ticker not in TICKERS:
+    if ticker not in _TICKER_SET:
         raise HTTPException(status_code=400, detail="Unsupported ticker")
     
-    from backend.mcp_integration import get_technical_indicators
-    
     try:
-        technicals = get_technical_indicators(ticker, period="6mo")
+        technicals = _technical_indicators(ticker, period="6mo")
         if not technicals:
             raise HTTPException(status_code=404, detail="No technical data available for this ticker")
         
@@ -397,13 +1123,11 @@ def get_fundamental_analysis(ticker: str):
     Returns:
         Dict with fundamental metrics: {trailingPE, marketCap, revenueGrowth, etc.}
     """
-    if ticker not in TICKERS:
+    if ticker not in _TICKER_SET:
         raise HTTPException(status_code=400, detail="Unsupported ticker")
     
-    from backend.mcp_integration import get_fundamental_snapshot
-    
     try:
-        fundamentals = get_fundamental_snapshot(ticker)
+        fundamentals = _fundamental_snapshot(ticker)
         if not fundamentals:
             raise HTTPException(status_code=404, detail="No fundamental data available for this ticker")
         
@@ -418,10 +1142,11 @@ def get_fundamental_analysis(ticker: str):
 
 
 @app.get("/analysis/{ticker}")
-def get_full_analysis(ticker: str):
+async def get_full_analysis(ticker: str):
     """
     Get both technical indicators and fundamental data for a specific ticker.
     Convenience endpoint that combines /technical and /fundamental.
+    The two yfinance lookups are independent, so they run concurrently.
     
     Args:
         ticker: Stock symbol (e.g., "AAPL", "TCS.NS")
@@ -429,38 +1154,38 @@ def get_full_analysis(ticker: str):
     Returns:
         Dict with both technical and fundamental analysis
     """
-    if ticker not in TICKERS:
+    if ticker not in _TICKER_SET:
         raise HTTPException(status_code=400, detail="Unsupported ticker")
     
-    from backend.mcp_integration import get_technical_indicators, get_fundamental_snapshot
-    
     result = {
         "ticker": ticker,  # Explicitly include ticker in response for verification
         "technical": {},
         "fundamental": {}
     }
     
-    # Fetch technical indicators with explicit ticker logging
-    try:
-        technicals = get_technical_indicators(ticker, period="6mo")
-        if technicals:
-            result["technical"] = technicals
-            # Add ticker to technical data for verification
-            result["technical"]["_ticker"] = ticker
-    except Exception as e:
-        print(f"Error fetching technicals for {ticker}: {e}")
+    technicals, fundamentals = await asyncio.gather(
+        run_in_threadpool(_technical_indicators, ticker, period="6mo"),
+        run_in_threadpool(_fundamental_snapshot, ticker),
+        return_exceptions=True,
+    )
+    
+    # Technical indicators, with explicit ticker logging
+    if isinstance(technicals, Exception):
+        print(f"Error fetching technicals for {ticker}: {technicals}")
         # Don't fail silently - log the error
+    elif technicals:
+        result["technical"] = dict(technicals)  # copy: the cached dict is shared
+        # Add ticker to technical data for verification
+        result["technical"]["_ticker"] = ticker
     
-    # Fetch fundamentals with explicit ticker logging
-    try:
-        fundamentals = get_fundamental_snapshot(ticker)
-        if fundamentals:
-            result["fundamental"] = fundamentals
-            # Add ticker to fundamental data for verification
-            result["fundamental"]["_ticker"] = ticker
-    except Exception as e:
-        print(f"Error fetching fundamentals for {ticker}: {e}")
+    # Fundamentals, with explicit ticker logging
+    if isinstance(fundamentals, Exception):
+        print(f"Error fetching fundamentals for {ticker}: {fundamentals}")
         # Don't fail silently - log the error
+    elif fundamentals:
+        result["fundamental"] = dict(fundamentals)  # copy: the cached dict is shared
+        # Add ticker to fundamental data for verification
+        result["fundamental"]["_ticker"] = ticker
     
     if not result["technical"] and not result["fundamental"]:
         raise HTTPException(
@@ -471,10 +1196,74 @@ def get_full_analysis(ticker: str):
     return result
 
 
+def _news_for_ticker(ticker: str) -> List[Dict]:
+    """One ticker's articles from this worker's cache, the shared cache, or yfinance."""
+    key = _news_cache_key(ticker)
+    items = _get_cache(key)
+    if items is not None:
+        return items
+    entry = _get_shared_many([key])[0]
+    if entry is not None:
+        _set_cache(key, entry[0], ttl=entry[1])
+        return entry[0]
+    items = _fetch_news_for_ticker(ticker)
+    if items is None:
+        return []
+    _store_ticker_news(ticker, items)
+    return items
+
+
+def _sentiment_for_tickers(tickers: List[str]) -> Dict[str, Tuple[float, int]]:
+    """
+    (avg_polarity, news_count) for a handful of tickers.
+    Uses the full sentiment snapshot when it is already warm; otherwise only
+    these tickers' news is fetched (per-ticker cache first) and scored,
+    instead of the whole universe.
+    """
+    snapshot = _cached_snapshot()
+    if snapshot is not None:
+        result = {}
+        for ticker in tickers:
+            i = _TICKER_INDEX[ticker]
+            news_count = int(snapshot["news_count"][i])
+            avg = float(snapshot["polarity_sum"][i]) / news_count if news_count else 0.0
+            result[ticker] = (avg, news_count)
+        return result
+
+    result = {}
+    for ticker, items in zip(tickers, _news_pool.map(_news_for_ticker, tickers)):
+        scores = _analyze_sentiment_batch([_article_text(n) for n in items])
+        polarity_sum = 0.0
+        for score in scores:
+            polarity_sum += score["polarity"]
+        result[ticker] = (polarity_sum / len(scores) if scores else 0.0, len(scores))
+    return result
+
+
+async def _compare_market_data(ticker: str) -> Tuple[Optional[float], Dict, Dict]:
+    """Current price, technicals and fundamentals for one ticker, fetched concurrently."""
+    price_data, technicals, fundamentals = await asyncio.gather(
+        run_in_threadpool(price_chart, ticker),
+        run_in_threadpool(_technical_indicators, ticker, period="6mo"),
+        run_in_threadpool(_fundamental_snapshot, ticker),
+        return_exceptions=True,
+    )
+    current_price = None
+    if not isinstance(price_data, Exception) and price_data.get("closes"):
+        current_price = price_data["closes"][-1]
+    if isinstance(technicals, Exception):
+        technicals = {}
+    if isinstance(fundamentals, Exception):
+        fundamentals = {}
+    return current_price, technicals, fundamentals
+
+
 @app.get("/compare")
-def compare_stocks(tickers: str):
+async def compare_stocks(tickers: str):
     """
     Compare multiple stocks side-by-side.
+    Sentiment and every ticker's price/technical/fundamental lookups run
+    concurrently, so latency tracks the slowest call rather than the sum.
     
     Args:
         tickers: Comma-separated list of ticker symbols (e.g., "AAPL,MSFT,GOOGL")
@@ -487,7 +1276,7 @@ def compare_stocks(tickers: str):
     ticker_list = [t.strip().upper() for t in tickers.split(",") if t.strip()]
     
     # Validate tickers
-    invalid_tickers = [t for t in ticker_list if t not in TICKERS]
+    invalid_tickers = [t for t in ticker_list if t not in _TICKER_SET]
     if invalid_tickers:
         raise HTTPException(
             status_code=400, 
@@ -507,47 +1296,17 @@ def compare_stocks(tickers: str):
             detail="At least 2 tickers required for comparison"
         )
     
-    from backend.mcp_integration import get_technical_indicators, get_fundamental_snapshot
-    
-    # Get recommendations data for sentiment
-    sentiments = sentiment()
-    sentiment_by_ticker = {item["ticker"]: item for item in sentiments}
+    # Sentiment for just these tickers, fetched alongside each ticker's market data
+    sentiment_by_ticker, *market_data = await asyncio.gather(
+        run_in_threadpool(_sentiment_for_tickers, ticker_list),
+        *[_compare_market_data(t) for t in ticker_list],
+    )
     
     comparison_data = []
     
-    for ticker in ticker_list:
+    for ticker, (current_price, technicals, fundamentals) in zip(ticker_list, market_data):
         # Get sentiment data
-        sentiment_data = sentiment_by_ticker.get(ticker, {})
-        avg_polarity = 0.0
-        news_count = 0
-        if sentiment_data:
-            # Calculate average polarity for this ticker
-            ticker_sentiments = [s for s in sentiments if s["ticker"] == ticker]
-            if ticker_sentiments:
-                polarities = [float(s["polarity"]) for s in ticker_sentiments]
-                avg_polarity = sum(polarities) / len(polarities) if polarities else 0.0
-                news_count = len(ticker_sentiments)
-        
-        # Get current price from price chart
-        try:
-            price_data = price_chart(ticker)
-            current_price = price_data["closes"][-1] if price_data.get("closes") else None
-        except Exception:
-            current_price = None
-        
-        # Get technical indicators
-        technicals = {}
-        try:
-            technicals = get_technical_indicators(ticker, period="6mo")
-        except Exception:
-            pass
-        
-        # Get fundamentals
-        fundamentals = {}
-        try:
-            fundamentals = get_fundamental_snapshot(ticker)
-        except Exception:
-            pass
+        avg_polarity, news_count = sentiment_by_ticker[ticker]
         
         # Build comparison entry
         entry = {
@@ -575,14 +1334,104 @@ def compare_stocks(tickers: str):
     }
 
 
+# Upper bound on sub-requests per /batch call
+BATCH_MAX_REQUESTS = 25
+# Read-only GET routes reachable through /batch (matched on the decoded path,
+# the same one routing sees); everything else, including /run-daily-report, is refused
+_BATCH_ALLOWED_PATHS = frozenset({
+    "/", "/health", "/price_chart", "/news", "/sentiment", "/recommendations",
+    "/compare", "/sector-analysis",
+})
+_BATCH_ALLOWED_PREFIXES = ("/technical/", "/fundamental/", "/analysis/")
+
+
+def _batch_path_allowed(path: str) -> bool:
+    route = urllib.parse.unquote(path.partition("?")[0])
+    return route in _BATCH_ALLOWED_PATHS or (
+        route.startswith(_BATCH_ALLOWED_PREFIXES) and route.count("/") == 2
+    )
+
+
+async def _dispatch_get(path: str) -> Dict:
+    """
+    Run one GET through the app in-process (routing, validation and
+    middleware included) and return its status code and decoded body.
+    """
+    raw_path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": urllib.parse.unquote(raw_path),
+        "raw_path": raw_path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [],
+        "client": None,
+        "server": None,
+    }
+    status_code = 500
+    chunks: List[bytes] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+
+    body = b"".join(chunks)
+    try:
+        payload = orjson.loads(body) if body else None
+    except orjson.JSONDecodeError:
+        # NDJSON streams and other non-JSON bodies come back as text
+        payload = body.decode("utf-8", errors="replace")
+    return {"path": path, "status": status_code, "body": payload}
+
+
+@app.post("/batch")
+async def batch(request: Request):
+    """
+    Run several GET requests in one round trip.
+
+    Body: {"requests": [{"path": "/technical/AAPL"}, {"path": "/price_chart?ticker=AAPL"}, ...]}
+    Sub-requests run concurrently and share the server-side caches.
+
+    Returns:
+        Dict keyed by the sub-request's index: {"0": {"path", "status", "body"}, ...}
+    """
+    try:
+        body = await request.json()
+        sub_requests = body["requests"]
+        paths = [str(item["path"]) for item in sub_requests]
+    except Exception:
+        raise HTTPException(status_code=400, detail='Body must be {"requests": [{"path": "/..."}, ...]}')
+
+    if len(paths) > BATCH_MAX_REQUESTS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_REQUESTS} requests per batch")
+    for path in paths:
+        if not _batch_path_allowed(path):
+            raise HTTPException(status_code=400, detail=f"Path not allowed in batch: {path}")
+
+    responses = await asyncio.gather(*(_dispatch_get(path) for path in paths))
+    return {str(i): resp for i, resp in enumerate(responses)}
+
+
 @app.get("/sector-analysis")
-def sector_analysis():
+async def sector_analysis():
     """
     Analyze stocks grouped by sector.
     Returns sector-level sentiment aggregation and recommendations.
     """
-    # Get all recommendations
-    recs = recommendations()
+    # Get all recommendations (a cold build blocks, so it stays off the loop)
+    recs = await run_in_threadpool(_build_recommendations)
     if not recs:
         return []
     
@@ -642,42 +1491,167 @@ def sector_analysis():
     }
 
 
+def _run_daily_report_subprocess() -> Dict:
+    """Run deploy_daily_report.py in a child interpreter (fallback path)."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    script_path = Path(__file__).parent.parent / "deploy_daily_report.py"
+    result = subprocess.run(
+        [sys.executable, str(script_path)],
+        capture_output=True,
+        text=True,
+        timeout=DAILY_REPORT_TIMEOUT,
+    )
+
+    if result.returncode == 0:
+        return {
+            "status": "success",
+            "message": "Daily report generated and emailed successfully",
+            "output": result.stdout,
+        }
+
+    # Non‑zero exit code → treat as internal error
+    raise HTTPException(
+        status_code=500,
+        detail={
+            "status": "error",
+            "message": "Failed to generate report",
+            "error": result.stderr,
+        },
+    )
+
+
+def _run_report_capturing_output(report_module) -> str:
+    """Run report_module.main() and return everything it logged meanwhile."""
+    buffer = io.StringIO()
+    handler = logging.StreamHandler(buffer)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    report_logger = report_module.logger
+    previous_level = report_logger.level
+    # The report logs progress at INFO; without basicConfig the root logger
+    # would drop it before it reaches the capture handler
+    if not report_logger.isEnabledFor(logging.INFO):
+        report_logger.setLevel(logging.INFO)
+    report_logger.addHandler(handler)
+    try:
+        report_module.main()
+    finally:
+        report_logger.removeHandler(handler)
+        report_logger.setLevel(previous_level)
+    return buffer.getvalue()
+
+
+# Latest report run (background or synchronous), reported by /run-daily-report/status
+_report_state: Dict = {"status": "idle"}
+_report_state_lock = threading.Lock()
+
+
+def _set_report_state(**fields) -> None:
+    with _report_state_lock:
+        _report_state.update(fields)
+
+
+def _claim_report_slot() -> Optional[str]:
+    """
+    Mark a report as queued unless one already is queued or running.
+    Returns the busy status in that case, None once the slot is claimed.
+    """
+    with _report_state_lock:
+        if _report_state["status"] in ("queued", "running"):
+            return _report_state["status"]
+        _report_state.clear()
+        _report_state.update(status="queued", queued_at=dt.datetime.utcnow().isoformat())
+    return None
+
+
+def _run_tracked_report(report_main, reraise: bool = False):
+    """Run the report on the report pool, recording its progress in _report_state."""
+    _set_report_state(status="running")
+    try:
+        result = report_main()
+        _set_report_state(status="success")
+        return result
+    except Exception as exc:
+        print(f"Daily report failed: {exc}")
+        _set_report_state(status="error", error=str(getattr(exc, "detail", exc)))
+        if reraise:
+            raise
+    finally:
+        _set_report_state(finished_at=dt.datetime.utcnow().isoformat())
+
+
+def _queue_daily_report(report_main) -> ORJSONResponse:
+    """Submit the report to the report pool and return 202 without waiting for it."""
+    busy = _claim_report_slot()
+    if busy is not None:
+        return ORJSONResponse(
+            status_code=202,
+            content={"status": busy, "message": "A daily report is already in progress"},
+        )
+
+    _report_pool.submit(_run_tracked_report, report_main)
+    return ORJSONResponse(
+        status_code=202,
+        content={"status": "queued", "message": "Daily report queued; poll /run-daily-report/status"},
+    )
+
+
 @app.get("/run-daily-report")
-def run_daily_report():
+def run_daily_report(background: bool = False):
     """
     Endpoint to trigger daily report generation (for cloud cron jobs).
-    Returns success on 200; raises HTTPException with 500 on error.
+    Runs the report in-process (no interpreter start-up); falls back to a
+    subprocess only if deploy_daily_report cannot be imported.
+    With background=true the report is queued and 202 is returned at once;
+    otherwise returns success on 200, 409 if a report is already queued or
+    running, and raises HTTPException with 500 on error.
     """
     try:
-        # Import here to avoid circular imports
-        import subprocess
-        import sys
-        from pathlib import Path
-
-        script_path = Path(__file__).parent.parent / "deploy_daily_report.py"
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
-        )
+        try:
+            # Import here to avoid circular imports (it imports this module)
+            import deploy_daily_report
+        except ImportError as exc:
+            print(f"deploy_daily_report not importable ({exc}); using subprocess")
+            if background:
+                return _queue_daily_report(_run_daily_report_subprocess)
+            return _run_daily_report_subprocess()
 
-        if result.returncode == 0:
-            return {
-                "status": "success",
-                "message": "Daily report generated and emailed successfully",
-                "output": result.stdout,
-            }
+        if background:
+            return _queue_daily_report(lambda: _run_report_capturing_output(deploy_daily_report))
 
-        # Non‑zero exit code → treat as internal error
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "status": "error",
-                "message": "Failed to generate report",
-                "error": result.stderr,
-            },
+        # Never queue a synchronous run behind another report: it would start
+        # (and email) after this request has already timed out
+        busy = _claim_report_slot()
+        if busy is not None:
+            raise HTTPException(
+                status_code=409,
+                detail={"status": busy, "message": "A daily report is already in progress"},
+            )
+
+        future = _report_pool.submit(
+            _run_tracked_report, lambda: _run_report_capturing_output(deploy_daily_report), True
         )
+        try:
+            output = future.result(timeout=DAILY_REPORT_TIMEOUT)
+        except FuturesTimeoutError:
+            if future.cancel():
+                _set_report_state(status="cancelled", finished_at=dt.datetime.utcnow().isoformat())
+                raise RuntimeError(f"Daily report did not start within {DAILY_REPORT_TIMEOUT} seconds; cancelled")
+            # A running thread cannot be killed; /run-daily-report/status shows when it ends
+            raise RuntimeError(
+                f"Daily report did not finish within {DAILY_REPORT_TIMEOUT} seconds; "
+                "it is still running, see /run-daily-report/status"
+            )
+
+        return {
+            "status": "success",
+            "message": "Daily report generated and emailed successfully",
+            "output": output,
+        }
+    except HTTPException:
+        raise
     except Exception as exc:
         # Unexpected exception → also return proper 500
         raise HTTPException(
@@ -686,3 +1660,8 @@ def run_daily_report():
         )
 
 
+@app.get("/run-daily-report/status")
+async def run_daily_report_status():
+    """State of the most recent background daily report run."""
+    with _report_state_lock:
+        return dict(_report_state)
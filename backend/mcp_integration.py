@@ -2,15 +2,21 @@
 MCP (Model Context Protocol) Financial Tools Integration
 Integrates MCP financial analysis tools into the recommendation pipeline.
 """
-from typing import Dict, List, Optional
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
 
 # Note: MCP tools are available via function calls, not direct imports
 # This module provides wrapper functions to integrate MCP financial tools
 
+logger = logging.getLogger(__name__)
+
+# .info is a slow scrape and fundamentals move slowly; reuse it for this long
+# (matches the fundamentals TTL in backend/main.py)
+INFO_CACHE_TTL = 6 * 3600
+
 
 def get_market_snapshot(tickers: List[str]) -> Dict:
     """
@@ -50,68 +56,92 @@ def get_technical_indicators(
         Dict with technical indicators: {rsi, sma: {20, 50, 200}, ema: {12, 26}}
     """
     try:
-        import yfinance as yf
-        import pandas as pd
-        import warnings
+        hist = get_history(ticker, period)
+        if hist is None:
+            return {}
         
-        # yfinance needs .NS/.BO suffix for Indian stocks, so keep it as-is
-        # Suppress yfinance warnings about delisted stocks
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=UserWarning)
-            warnings.filterwarnings("ignore", category=FutureWarning)
-            
-            # Create a fresh Ticker object for each call to avoid caching issues
-            stock = yf.Ticker(ticker)
-            
-            # Fetch historical data with explicit timeout and error handling
-            try:
-                hist = stock.history(period=period, interval="1d", timeout=10, quiet=True)
-            except Exception as e:
-                print(f"Error fetching history for {ticker}: {e}")
-                return {}
+        return indicators_from_history(ticker, hist, sma_windows, ema_windows, rsi_window)
+    except Exception as e:
+        # Log the error for debugging
+        logger.exception("Exception in get_technical_indicators for %s: %s", ticker, e)
+        return {}
+
+
+def get_history(ticker: str, period: str = "6mo"):
+    """
+    Daily OHLCV history for one ticker, or None if the fetch failed.
+    
+    Args:
+        ticker: Stock symbol (keep .NS/.BO suffix for Indian stocks)
+        period: History period (e.g., "3mo", "6mo", "1y")
+    """
+    import warnings
+    from backend.yf_pool import get_ticker, with_retry
+    
+    # yfinance needs .NS/.BO suffix for Indian stocks, so keep it as-is
+    # Suppress yfinance warnings about delisted stocks
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning)
+        warnings.filterwarnings("ignore", category=FutureWarning)
+        
+        # Create a fresh Ticker object for each call to avoid caching issues
+        stock = get_ticker(ticker)
+        
+        # Fetch historical data with explicit timeout and error handling
+        try:
+            return with_retry(lambda: stock.history(period=period, interval="1d", timeout=10, quiet=True))
+        except Exception as e:
+            logger.warning("Error fetching history for %s: %s", ticker, e)
+            return None
+
+
+def indicators_from_history(
+    ticker: str,
+    hist,
+    sma_windows: List[int] = [20, 50, 200],
+    ema_windows: List[int] = [12, 26],
+    rsi_window: int = 14
+) -> Dict:
+    """
+    Compute RSI/SMA/EMA from an already-fetched daily history DataFrame.
+    Shared by get_technical_indicators and backend.ticker_bundle.
+    """
+    try:
+        import numpy as np
+        import pandas as pd
         
         if hist.empty or len(hist) < 20:  # Need at least 20 days for meaningful indicators
-            print(f"Warning: Insufficient data for {ticker} (got {len(hist)} rows)")
+            logger.warning("Insufficient data for %s (got %d rows)", ticker, len(hist))
             return {}
         
         close_prices = hist["Close"]
         
         # Validate we have actual price data
         if close_prices.isna().all() or close_prices.empty:
-            print(f"Warning: No valid price data for {ticker}")
+            logger.warning("No valid price data for %s", ticker)
             return {}
         
-        # Calculate RSI
-        def calculate_rsi(prices: pd.Series, window: int = 14) -> float:
-            if len(prices) < window + 1:
-                return 50.0  # Default neutral RSI
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-            # Avoid division by zero
-            rs = gain / (loss + 1e-10)
-            rsi = 100 - (100 / (1 + rs))
-            return float(rsi.iloc[-1]) if not rsi.empty and not pd.isna(rsi.iloc[-1]) else 50.0
+        # Only the latest RSI/SMA/EMA values are reported, so compute them
+        # straight from the numpy array instead of building full rolling/ewm Series
+        closes = close_prices.to_numpy(dtype=np.float64)
         
-        rsi_value = calculate_rsi(close_prices, rsi_window)
+        # Calculate RSI
+        rsi_value = _rsi_last(closes, rsi_window)
         
-        # Calculate SMAs
+        # Calculate SMAs: only the trailing `window` closes matter
+        missing = np.isnan(closes)
         sma_dict = {}
         for window in sma_windows:
-            if len(close_prices) >= window:
-                sma = close_prices.rolling(window=window).mean()
-                sma_val = sma.iloc[-1] if not sma.empty else None
-                sma_dict[str(window)] = float(sma_val) if sma_val is not None and not pd.isna(sma_val) else None
+            if len(closes) >= window and not missing[-window:].any():
+                sma_dict[str(window)] = float(closes[-window:].mean())
             else:
                 sma_dict[str(window)] = None
         
         # Calculate EMAs
         ema_dict = {}
         for window in ema_windows:
-            if len(close_prices) >= window:
-                ema = close_prices.ewm(span=window, adjust=False).mean()
-                ema_val = ema.iloc[-1] if not ema.empty else None
-                ema_dict[str(window)] = float(ema_val) if ema_val is not None and not pd.isna(ema_val) else None
+            if len(closes) >= window:
+                ema_dict[str(window)] = _ema_last(closes, window)
             else:
                 ema_dict[str(window)] = None
         
@@ -125,17 +155,74 @@ def get_technical_indicators(
         }
         
         # Debug: Log that we got data for this specific ticker
-        print(f"Technical data for {ticker}: RSI={rsi_value:.2f}, Price={current_price}")
+        logger.debug("Technical data for %s: RSI=%.2f, Price=%s", ticker, rsi_value, current_price)
         
         return result
     except Exception as e:
         # Log the error for debugging
-        print(f"Exception in get_technical_indicators for {ticker}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Exception computing technical indicators for %s: %s", ticker, e)
         return {}
 
 
+def _rsi_last(values, window: int = 14) -> float:
+    """
+    Latest RSI using simple averages of the last `window` gains/losses (the
+    final value of the rolling(window).mean() formulation). Missing prices
+    count as no change.
+    """
+    import numpy as np
+    
+    if len(values) < window + 1:
+        return 50.0  # Default neutral RSI
+    delta = np.diff(values[-(window + 1):])
+    # NaN compares False on both sides, so gaps contribute 0 to gain and loss
+    gain = np.where(delta > 0, delta, 0.0).sum() / window
+    loss = np.where(delta < 0, -delta, 0.0).sum() / window
+    # Avoid division by zero
+    rs = gain / (loss + 1e-10)
+    rsi = 100 - (100 / (1 + rs))
+    return float(rsi) if np.isfinite(rsi) else 50.0
+
+
+def _ema_last(values, span: int) -> Optional[float]:
+    """
+    Last value of the adjust=False EMA (pandas ewm(span=span, adjust=False)).
+    The recursion y[t] = (1 - a) * y[t-1] + a * x[t] with y[0] = x[0] unrolls
+    to a single dot product with geometric weights, so no Python loop is needed.
+    Gaps (NaN) inside the series decay and renormalize the weights in pandas,
+    which the closed form doesn't model, so those series go through ewm.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) == 0:
+        return None
+    # Leading NaNs are skipped by ewm; trailing ones just repeat the last value
+    values = values[valid[0]:valid[-1] + 1]
+    if len(valid) != len(values):
+        return float(pd.Series(values).ewm(span=span, adjust=False).mean().iloc[-1])
+    alpha = 2.0 / (span + 1)
+    weights = (1.0 - alpha) ** np.arange(len(values) - 1, -1, -1, dtype=np.float64)
+    weights[1:] *= alpha
+    return float(weights @ values)
+
+
+@lru_cache(maxsize=512)
+def info_cached(ticker: str, bucket: int) -> Dict:
+    """
+    Ticker.info for `ticker`, memoized per time bucket (pass the current
+    bucket; a new bucket means a fresh fetch). Raises on empty/invalid info
+    so failures are not cached. Callers must not mutate the returned dict.
+    """
+    from backend.yf_pool import get_ticker, with_retry
+    
+    info = with_retry(lambda: get_ticker(ticker).info)
+    if not info or len(info) < 5:
+        raise ValueError("empty or invalid info")
+    return info
+
+
 def get_fundamental_snapshot(ticker: str) -> Dict:
     """
     Get fundamental data (earnings, revenue, valuation) using yfinance.
@@ -148,7 +235,6 @@ def get_fundamental_snapshot(ticker: str) -> Dict:
         Dict with fundamental metrics: {trailingPE, marketCap, revenueGrowth, earningsGrowth, etc.}
     """
     try:
-        import yfinance as yf
         import warnings
         
         # yfinance needs .NS/.BO suffix for Indian stocks, so keep it as-is
@@ -157,105 +243,98 @@ def get_fundamental_snapshot(ticker: str) -> Dict:
             warnings.filterwarnings("ignore", category=UserWarning)
             warnings.filterwarnings("ignore", category=FutureWarning)
             
-            # Create a fresh Ticker object for each call to avoid caching issues
-            stock = yf.Ticker(ticker)
-            
             try:
-                # Fetch info with explicit timeout
-                info = stock.info
-                
-                # Check if info is empty or invalid
-                if not info or len(info) < 5:
-                    print(f"Warning: Empty or invalid info for {ticker}")
-                    return {}
+                info = info_cached(ticker, int(time.time() // INFO_CACHE_TTL))
+            except ValueError:
+                logger.warning("Empty or invalid info for %s", ticker)
+                return {}
             except Exception as e:
-                print(f"Error fetching info for {ticker}: {e}")
+                logger.warning("Error fetching info for %s: %s", ticker, e)
                 return {}
         
-        # Extract key fundamentals - handle both US and Indian stock formats
-        fundamentals = {
-            "trailingPE": info.get("trailingPE") or info.get("trailingPegRatio"),
-            "forwardPE": info.get("forwardPE") or info.get("forwardPegRatio"),
-            "marketCap": info.get("marketCap") or info.get("totalAssets"),
-            "revenueGrowth": info.get("revenueGrowth") or info.get("revenuePerShare"),
-            "earningsGrowth": info.get("earningsGrowth") or info.get("earningsQuarterlyGrowth"),
-            "profitMargins": info.get("profitMargins") or info.get("grossMargins"),
-            "dividendYield": info.get("dividendYield") or info.get("dividendRate"),
-            "currentPrice": info.get("currentPrice") or info.get("regularMarketPrice") or info.get("previousClose"),
-            "targetMeanPrice": info.get("targetMeanPrice") or info.get("targetHighPrice"),
-            "bookValue": info.get("bookValue"),
-            "priceToBook": info.get("priceToBook"),
-        }
-        
-        # Remove None values and validate data
-        cleaned = {k: v for k, v in fundamentals.items() if v is not None}
-        
-        # Debug: Log that we got data for this specific ticker
-        if cleaned:
-            print(f"Fundamental data for {ticker}: P/E={cleaned.get('trailingPE')}, MarketCap={cleaned.get('marketCap')}")
-        else:
-            print(f"Warning: No fundamental data extracted for {ticker}")
-        
-        return cleaned
+        return fundamentals_from_info(ticker, info)
     except Exception as e:
         # Log the error for debugging
-        print(f"Exception in get_fundamental_snapshot for {ticker}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Exception in get_fundamental_snapshot for %s: %s", ticker, e)
         return {}
 
 
-def enhance_recommendation_with_mcp(
-    ticker: str,
-    sentiment_score: float,
-    base_recommendation: str
-) -> Dict:
+def fundamentals_from_info(ticker: str, info: Dict) -> Dict:
     """
-    Enhance recommendation by combining sentiment with MCP technical/fundamental data.
+    Pick the reported fundamentals out of a Ticker.info dict.
+    Shared by get_fundamental_snapshot and backend.ticker_bundle.
+    """
+    # Extract key fundamentals - handle both US and Indian stock formats
+    fundamentals = {
+        "trailingPE": info.get("trailingPE") or info.get("trailingPegRatio"),
+        "forwardPE": info.get("forwardPE") or info.get("forwardPegRatio"),
+        "marketCap": info.get("marketCap") or info.get("totalAssets"),
+        "revenueGrowth": info.get("revenueGrowth") or info.get("revenuePerShare"),
+        "earningsGrowth": info.get("earningsGrowth") or info.get("earningsQuarterlyGrowth"),
+        "profitMargins": info.get("profitMargins") or info.get("grossMargins"),
+        "dividendYield": info.get("dividendYield") or info.get("dividendRate"),
+        "currentPrice": info.get("currentPrice") or info.get("regularMarketPrice") or info.get("previousClose"),
+        "targetMeanPrice": info.get("targetMeanPrice") or info.get("targetHighPrice"),
+        "bookValue": info.get("bookValue"),
+        "priceToBook": info.get("priceToBook"),
+    }
+    
+    # Remove None values and validate data
+    cleaned = {k: v for k, v in fundamentals.items() if v is not None}
+    
+    # Debug: Log that we got data for this specific ticker
+    if cleaned:
+        logger.debug("Fundamental data for %s: P/E=%s, MarketCap=%s", ticker, cleaned.get("trailingPE"), cleaned.get("marketCap"))
+    else:
+        logger.warning("No fundamental data extracted for %s", ticker)
+    
+    return cleaned
+
+
+def fetch_many(fetch: Callable[[str], Dict], tickers: List[str], max_workers: int) -> Dict[str, Dict]:
+    """Run a per-ticker fetcher over many tickers concurrently; {ticker: result}."""
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as executor:
+        return dict(zip(tickers, executor.map(fetch, tickers)))
+
+
+def get_bulk_history(tickers: List[str], period: str = "6mo") -> Dict:
+    """
+    Daily history for many tickers with a single batched yf.download.
     
     Args:
-        ticker: Stock symbol
-        sentiment_score: Sentiment polarity score
-        base_recommendation: Base recommendation from sentiment (Buy/Hold/Sell)
+        tickers: Stock symbols (keep .NS/.BO suffix for Indian stocks)
+        period: History period (e.g., "1mo", "6mo")
         
     Returns:
-        Enhanced recommendation dict with:
-        - recommendation: Final Buy/Hold/Sell
-        - confidence: Confidence score
-        - factors: Dict of contributing factors (sentiment, technical, fundamental)
+        Dict mapping ticker -> OHLCV DataFrame; tickers Yahoo returned nothing for are omitted
     """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
     try:
-        # Get technical indicators
-        technicals = get_technical_indicators(ticker)
-        
-        # Get fundamentals
-        fundamentals = get_fundamental_snapshot(ticker)
-        
-        # Combine factors (weighted scoring)
-        # TODO: Implement weighted scoring logic
-        factors = {
-            "sentiment": sentiment_score,
-            "technical": technicals,
-            "fundamental": fundamentals
-        }
-        
-        # Enhanced recommendation logic
-        # For now, return base recommendation
-        # TODO: Implement sophisticated scoring
+        import warnings
+        from backend.yf_pool import download
         
-        return {
-            "ticker": ticker,
-            "recommendation": base_recommendation,
-            "confidence": 0.5,  # Placeholder
-            "factors": factors
-        }
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=UserWarning)
+            warnings.filterwarnings("ignore", category=FutureWarning)
+            frame = download(
+                tickers, period=period, interval="1d", group_by="ticker", threads=True, progress=False
+            )
     except Exception as e:
-        # Fallback to base recommendation if MCP fails
-        return {
-            "ticker": ticker,
-            "recommendation": base_recommendation,
-            "confidence": 0.3,
-            "factors": {"sentiment": sentiment_score},
-            "error": str(e)
-        }
-
+        logger.warning("Error fetching bulk history for %d tickers: %s", len(tickers), e)
+        return {}
+    
+    history = {}
+    available = set(frame.columns.get_level_values(0))
+    for ticker in tickers:
+        if ticker not in available:
+            continue
+        # Mixed US/Indian calendars leave all-NaN rows on the other market's holidays
+        data = frame[ticker].dropna(how="all")
+        if not data.empty:
+            history[ticker] = data
+    return history
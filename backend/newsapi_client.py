@@ -3,18 +3,74 @@ NewsAPI.ai client (or compatible) for fetching news articles by query.
 The API key is provided by the user (limited tokens); we keep calls minimal and handle errors gracefully.
 """
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict
+import orjson
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-load_dotenv()
 
-# Event Registry / NewsAPI.ai style config
-NEWSAPI_AI_KEY = (os.getenv("NEWSAPI_AI_KEY", "") or "").strip()
-# Base URL points to Event Registry article API by default
-NEWSAPI_AI_BASE_URL = (
-    os.getenv("NEWSAPI_AI_BASE_URL", "https://eventregistry.org/api/v1") or ""
-).strip().rstrip("/")
+@dataclass(frozen=True)
+class NewsAPIConfig:
+    api_key: str
+    base_url: str
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.base_url}/article/getArticles"
+
+
+@lru_cache(maxsize=1)
+def get_config() -> NewsAPIConfig:
+    """
+    Resolve NewsAPI settings once, on first use rather than at import.
+    In production the variables are baked into the environment, so .env is
+    only read for local runs.
+    """
+    if os.getenv("PYTHON_ENV") != "production":
+        from dotenv import load_dotenv
+
+        load_dotenv()
+    # Event Registry / NewsAPI.ai style config
+    return NewsAPIConfig(
+        api_key=(os.getenv("NEWSAPI_AI_KEY", "") or "").strip(),
+        # Base URL points to Event Registry article API by default
+        base_url=(
+            os.getenv("NEWSAPI_AI_BASE_URL", "https://eventregistry.org/api/v1") or ""
+        ).strip().rstrip("/"),
+    )
+
+
+# One pooled session per process so repeated queries reuse the TCP/TLS connection.
+# getArticles is a read-only search sent as POST, so POST is safe to retry on
+# rate limiting and transient server errors.
+_retry = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset({"GET", "POST"}),
+    raise_on_status=False,
+)
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_retry))
+_session.headers.update({"Content-Type": "application/json", "Accept-Encoding": "gzip, deflate"})
+
+# Static part of the Event Registry / NewsAPI.ai style request body; the
+# apiKey is added per request from get_config().
+# See: https://eventregistry.org/documentation (Get articles)
+_BASE_PAYLOAD = {
+    "action": "getArticles",
+    "keywordLoc": "title,body",
+    "articlesPage": 1,
+    "articlesSortBy": "date",
+    "articlesSortByAsc": False,
+    "dataType": ["news"],
+    "resultType": "articles",
+    # Limit to recent window to keep responses small
+    "forceMaxDataTimeWindow": 7,
+}
 
 
 def search_news_for_query(query: str, limit: int = 20) -> List[Dict]:
@@ -24,44 +80,38 @@ def search_news_for_query(query: str, limit: int = 20) -> List[Dict]:
     if not query:
         return []
 
-    if not NEWSAPI_AI_KEY:
+    config = get_config()
+    if not config.api_key:
         print("NEWSAPI_AI_KEY not configured; skipping news fetch")
         return []
 
-    endpoint = f"{NEWSAPI_AI_BASE_URL}/article/getArticles"
-
-    # Build minimal Event Registry / NewsAPI.ai style request body.
-    # See: https://eventregistry.org/documentation (Get articles)
-    payload = {
-        "action": "getArticles",
-        "keyword": query,
-        "keywordLoc": "title,body",
-        "articlesPage": 1,
-        "articlesCount": min(limit, 20),
-        "articlesSortBy": "date",
-        "articlesSortByAsc": False,
-        "dataType": ["news"],
-        "resultType": "articles",
-        # Limit to recent window to keep responses small
-        "forceMaxDataTimeWindow": 7,
-        "apiKey": NEWSAPI_AI_KEY,
-    }
+    payload = _build_payload(config, query, limit)
 
     try:
-        resp = requests.post(
-            endpoint,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=15,
-        )
+        resp = _session.post(config.endpoint, json=payload, timeout=15)
         if resp.status_code != 200:
             print(f"NewsAPI search failed {resp.status_code}: {resp.text[:200]}")
             return []
-        data = resp.json() if resp.text else {}
+        data = orjson.loads(resp.content) if resp.content else {}
     except Exception as exc:
         print(f"NewsAPI search error for '{query}': {exc}")
         return []
 
+    return _clean_articles(data, query)
+
+
+def _build_payload(config: NewsAPIConfig, query: str, limit: int) -> Dict:
+    """Request body for one getArticles query."""
+    return {
+        **_BASE_PAYLOAD,
+        "apiKey": config.api_key,
+        "keyword": query,
+        "articlesCount": min(limit, 20),
+    }
+
+
+def _clean_articles(data, query: str) -> List[Dict]:
+    """Normalize a getArticles response into our news item dicts."""
     # For resultType='articles', Event Registry returns:
     # { "articles": { "results": [ ... ] } }
     articles_container = data.get("articles", {})
@@ -72,23 +122,36 @@ def search_news_for_query(query: str, limit: int = 20) -> List[Dict]:
         or (data if isinstance(data, list) else [])
     )
 
-    cleaned: List[Dict] = []
-    for item in articles:
-        if not isinstance(item, dict):
-            continue
-        cleaned.append(
-            {
-                "ticker": query,
-                "title": item.get("title", "") or item.get("headline", ""),
-                "summary": item.get("description", item.get("summary", "")),
-                "publisher": (
-                    item.get("source", {}).get("name", "")
-                    if isinstance(item.get("source"), dict)
-                    else item.get("source", item.get("publisher", ""))
-                ),
-                "link": item.get("url", item.get("link", "")),
-            }
-        )
-
-    return cleaned
+    items = [item for item in articles if isinstance(item, dict)]
+    if not items:
+        return []
+
+    # One response has one schema: pick the extractor once from the first item
+    extract = _extract_event_registry if "uri" in items[0] else _extract_generic
+    return [extract(item, query) for item in items]
 
+
+def _extract_event_registry(item: Dict, query: str) -> Dict:
+    """Event Registry / NewsAPI.ai article: source is {"uri", "title"}, text is in "body"."""
+    return {
+        "ticker": query,
+        "title": item.get("title") or "",
+        "summary": item.get("body") or "",
+        "publisher": (item.get("source") or {}).get("title") or "",
+        "link": item.get("url") or "",
+    }
+
+
+def _extract_generic(item: Dict, query: str) -> Dict:
+    """Other NewsAPI-compatible shapes (headline/description/source name variants)."""
+    return {
+        "ticker": query,
+        "title": item.get("title", "") or item.get("headline", ""),
+        "summary": item.get("description", item.get("summary", "")),
+        "publisher": (
+            item.get("source", {}).get("name", "")
+            if isinstance(item.get("source"), dict)
+            else item.get("source", item.get("publisher", ""))
+        ),
+        "link": item.get("url", item.get("link", "")),
+    }
@@ -3,6 +3,7 @@ Sector mapping for US and Indian stocks.
 Used for sector-based analysis and grouping.
 """
 
+from types import MappingProxyType
 from typing import List
 
 # US Stock Sector Mapping
@@ -149,6 +150,11 @@ INDIAN_SECTOR_MAP = {
 }
 
 
+# Both maps merged once at import (US entries win, as in the old lookup order)
+_ALL_SECTORS = MappingProxyType({**INDIAN_SECTOR_MAP, **US_SECTOR_MAP})
+_ALL_SECTORS_SORTED = tuple(sorted(set(_ALL_SECTORS.values())))
+
+
 def get_sector(ticker: str) -> str:
     """
     Get sector for a given ticker.
@@ -159,19 +165,10 @@ def get_sector(ticker: str) -> str:
     Returns:
         Sector name or "Unknown" if not found
     """
-    # Check US stocks first
-    if ticker in US_SECTOR_MAP:
-        return US_SECTOR_MAP[ticker]
-    
-    # Check Indian stocks
-    if ticker in INDIAN_SECTOR_MAP:
-        return INDIAN_SECTOR_MAP[ticker]
-    
-    return "Unknown"
+    return _ALL_SECTORS.get(ticker, "Unknown")
 
 
 def get_all_sectors() -> List[str]:
     """Get list of all unique sectors."""
-    sectors = set(US_SECTOR_MAP.values()) | set(INDIAN_SECTOR_MAP.values())
-    return sorted(list(sectors))
+    return list(_ALL_SECTORS_SORTED)
 
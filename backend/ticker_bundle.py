@@ -0,0 +1,129 @@
+"""
+Per-ticker market data fetched once and shared by every analysis stage.
+get_bundles() pulls history for all tickers with one batched yf.download and
+.info on a thread pool, concurrently, and keeps the bundles for BUNDLE_TTL;
+technical and fundamental figures are then computed from the bundle instead
+of going back to Yahoo per stage.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from backend.mcp_integration import (
+    INFO_CACHE_TTL,
+    fetch_many,
+    fundamentals_from_info,
+    get_bulk_history,
+    get_history,
+    indicators_from_history,
+    info_cached,
+)
+
+logger = logging.getLogger(__name__)
+
+# History window the bundles carry (what the technical indicators use)
+BUNDLE_PERIOD = "6mo"
+# How long a prefetched bundle is served before it is fetched again
+BUNDLE_TTL = 3600
+
+
+@dataclass(frozen=True)
+class TickerBundle:
+    ticker: str
+    history: pd.DataFrame  # daily OHLCV; empty if Yahoo returned nothing
+    info: Dict  # Ticker.info; empty on failure
+    last_price: Optional[float]
+    fetched_at: float
+
+
+_bundles: Dict[str, TickerBundle] = {}
+_bundles_lock = threading.Lock()
+
+
+def _info_or_empty(ticker: str) -> Dict:
+    try:
+        return info_cached(ticker, int(time.time() // INFO_CACHE_TTL))
+    except Exception as e:
+        logger.warning("Error fetching info for %s: %s", ticker, e)
+        return {}
+
+
+def _history_for(tickers: List[str], max_workers: int) -> Dict[str, pd.DataFrame]:
+    """Bulk history, with per-ticker fetches for symbols the batch missed."""
+    history = get_bulk_history(tickers, period=BUNDLE_PERIOD)
+    missing = [t for t in tickers if t not in history]
+    fallback = fetch_many(lambda t: get_history(t, BUNDLE_PERIOD), missing, max_workers)
+    history.update({t: hist for t, hist in fallback.items() if hist is not None})
+    return history
+
+
+def _last_price(history: pd.DataFrame, info: Dict) -> Optional[float]:
+    if not history.empty:
+        closes = history["Close"].dropna()
+        if not closes.empty:
+            return float(closes.iloc[-1])
+    price = info.get("currentPrice") or info.get("regularMarketPrice")
+    return float(price) if price is not None else None
+
+
+def _fetch_bundles(tickers: List[str], max_workers: int) -> Dict[str, TickerBundle]:
+    # The batched download and the .info pulls hit different endpoints
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        f_hist = executor.submit(_history_for, tickers, max_workers)
+        f_info = executor.submit(fetch_many, _info_or_empty, tickers, max_workers)
+        history = f_hist.result()
+        infos = f_info.result()
+
+    now = time.time()
+    bundles = {}
+    for ticker in tickers:
+        hist = history.get(ticker)
+        if hist is None:
+            hist = pd.DataFrame()
+        info = infos.get(ticker) or {}
+        bundles[ticker] = TickerBundle(ticker, hist, info, _last_price(hist, info), now)
+    return bundles
+
+
+def get_bundles(tickers: List[str], max_workers: int = 8) -> Dict[str, TickerBundle]:
+    """
+    Bundles for `tickers`: cached ones younger than BUNDLE_TTL are reused and
+    the rest are fetched together.
+
+    Returns:
+        Dict mapping ticker -> TickerBundle (every requested ticker is present)
+    """
+    tickers = list(dict.fromkeys(tickers))
+    now = time.time()
+    with _bundles_lock:
+        bundles = {
+            t: _bundles[t] for t in tickers
+            if t in _bundles and now - _bundles[t].fetched_at < BUNDLE_TTL
+        }
+    stale = [t for t in tickers if t not in bundles]
+    if stale:
+        fetched = _fetch_bundles(stale, max_workers)
+        with _bundles_lock:
+            # Partial bundles (a failed download or .info) are retried next time
+            _bundles.update({t: b for t, b in fetched.items() if not b.history.empty and b.info})
+        bundles.update(fetched)
+    return {t: bundles[t] for t in tickers}
+
+
+def technical_indicators(bundle: TickerBundle) -> Dict:
+    """get_technical_indicators() result computed from the bundle's history."""
+    if bundle.history.empty:
+        return {}
+    return indicators_from_history(bundle.ticker, bundle.history)
+
+
+def fundamental_snapshot(bundle: TickerBundle) -> Dict:
+    """get_fundamental_snapshot() result computed from the bundle's info."""
+    if not bundle.info:
+        return {}
+    return fundamentals_from_info(bundle.ticker, bundle.info)
@@ -66,7 +66,8 @@ US_TICKERS = [
 ]
 
 # Validation: Ensure no duplicates
-_duplicates = [ticker for ticker in US_TICKERS if US_TICKERS.count(ticker) > 1]
+_seen = set()
+_duplicates = {ticker for ticker in US_TICKERS if ticker in _seen or _seen.add(ticker)}
 if _duplicates:
-    raise ValueError(f"Duplicate tickers found in US_TICKERS: {set(_duplicates)}")
+    raise ValueError(f"Duplicate tickers found in US_TICKERS: {_duplicates}")
 
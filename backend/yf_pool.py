@@ -0,0 +1,54 @@
+"""
+Single access point for yfinance calls.
+yfinance already shares one curl_cffi session (keep-alive, browser
+fingerprint) across every Ticker, so this module doesn't build its own
+session; it adds bounded retry with backoff when Yahoo rate-limits us and
+serializes yf.download, whose results live in module-level state.
+"""
+import threading
+import time
+from typing import Callable, TypeVar
+
+import yfinance as yf
+
+try:
+    from yfinance.exceptions import YFRateLimitError
+except ImportError:  # older yfinance without a dedicated rate-limit error
+    YFRateLimitError = None
+
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.3  # seconds; doubles on each retry
+
+T = TypeVar("T")
+
+_download_lock = threading.Lock()
+
+
+def get_ticker(symbol: str) -> yf.Ticker:
+    """
+    Fresh Ticker for `symbol` (Ticker caches .news/.info on the instance, so
+    instances are not reused across requests).
+    """
+    return yf.Ticker(symbol)
+
+
+def with_retry(fetch: Callable[[], T], attempts: int = RETRY_ATTEMPTS, backoff: float = RETRY_BACKOFF) -> T:
+    """
+    Call `fetch()`, retrying with exponential backoff on Yahoo rate limiting.
+    Any other exception propagates immediately.
+    """
+    for attempt in range(attempts):
+        try:
+            return fetch()
+        except Exception as e:
+            if YFRateLimitError is None or not isinstance(e, YFRateLimitError) or attempt == attempts - 1:
+                raise
+            delay = backoff * (2 ** attempt)
+            print(f"Yahoo rate limit hit; retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+def download(*args, **kwargs):
+    """yf.download, one call at a time, with rate-limit retry."""
+    with _download_lock:
+        return with_retry(lambda: yf.download(*args, **kwargs))
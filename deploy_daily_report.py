@@ -1,50 +1,71 @@
-import csv
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from email.message import EmailMessage
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple, Union
 
 import smtplib
 
+import pandas as pd
 from dotenv import load_dotenv
 
-from backend.main import TICKERS, _fetch_news_for_ticker, _analyze_sentiment, _recommendation_from_score
+from backend.main import TICKERS, _fetch_news_for_ticker, _analyze_sentiment_batch, _recommendation_from_score
 # TICKERS now uses Indian stocks from backend.indian_tickers
 
 
 BASE_DIR = Path(__file__).resolve().parent
 OUTPUT_CSV = BASE_DIR / "recommendations_daily.csv"
 
+# Progress goes through logging (not print) so /run-daily-report can capture
+# it with a handler when the report runs inside the API process.
+logger = logging.getLogger(__name__)
 
-def generate_recommendations() -> List[Dict]:
+# Threads for the per-ticker news fetch (network-bound)
+NEWS_WORKERS = int(os.getenv("NEWS_WORKERS", "8"))
+
+
+def _safe_fetch(ticker: str) -> Tuple[str, Union[List[Dict], Exception]]:
+    """Fetch one ticker's news, returning the exception instead of raising."""
+    try:
+        return ticker, _fetch_news_for_ticker(ticker) or []  # None: failed, already logged
+    except Exception as e:
+        return ticker, e
+
+
+# Report columns, in CSV order
+REPORT_COLUMNS = ["ticker", "avg_polarity", "recommendation", "news_count"]
+
+
+def generate_recommendations() -> pd.DataFrame:
     """
     Standalone generation of recommendations so this script does NOT
     require the FastAPI server to be running.
+    Returns one row per ticker with news, columns REPORT_COLUMNS.
     """
     all_news: List[Dict] = []
-    for t in TICKERS:
-        try:
-            fetched = _fetch_news_for_ticker(t)
-            all_news.extend(fetched)
-            if t == TICKERS[0] and fetched:  # Debug: show first ticker's first item
-                sample = fetched[0] if fetched else None
-                if sample:
-                    print(f"Sample cleaned news item for {t}: title='{sample.get('title', '')[:50]}...'")
-        except Exception as e:
-            print(f"Warning: Failed to fetch news for {t}: {e}")
-            import traceback
-            traceback.print_exc()
+    # Fetch concurrently; map() keeps results in TICKERS order
+    with ThreadPoolExecutor(max_workers=NEWS_WORKERS) as ex:
+        results = list(ex.map(_safe_fetch, TICKERS))
+
+    for t, fetched in results:
+        if isinstance(fetched, Exception):
+            logger.error("Failed to fetch news for %s: %s", t, fetched, exc_info=fetched)
             continue
+        all_news.extend(fetched)
+        if t == TICKERS[0] and fetched:  # Debug: show first ticker's first item
+            sample = fetched[0]
+            logger.info("Sample cleaned news item for %s: title='%.50s...'", t, sample.get("title", ""))
 
-    print(f"Fetched {len(all_news)} total news items across all tickers")
+    logger.info("Fetched %d total news items across all tickers", len(all_news))
     
     if not all_news:
-        print("Warning: No news items fetched for any ticker!")
-        return []
+        logger.warning("No news items fetched for any ticker!")
+        return pd.DataFrame(columns=REPORT_COLUMNS)
 
     # Per‑article sentiment
-    per_article: List[Dict] = []
+    pairs: List[Tuple[str, str]] = []
     empty_count = 0
     for item in all_news:
         title = item.get("title", "")
@@ -55,56 +76,51 @@ def generate_recommendations() -> List[Dict]:
             # Skip empty items
             empty_count += 1
             continue
-        scores = _analyze_sentiment(combined_text)
-        per_article.append(
-            {
-                "ticker": item.get("ticker"),
-                "polarity": scores["polarity"],
-            }
-        )
+        pairs.append((item.get("ticker"), combined_text))
+
+    # Score every article in one batch (deduplicated, multi-core when large)
+    scores_list = _analyze_sentiment_batch([text for _, text in pairs])
+    per_article: List[Dict] = [
+        {"ticker": ticker, "polarity": scores["polarity"]}
+        for (ticker, _), scores in zip(pairs, scores_list)
+    ]
     
-    print(f"Analyzed {len(per_article)} articles with text (skipped {empty_count} empty items)")
-
-    # Aggregate
-    by_ticker: Dict[str, List[float]] = {}
-    for row in per_article:
-        t = row["ticker"]
-        if t is None:
-            continue
-        by_ticker.setdefault(t, []).append(float(row["polarity"]))
-
-    rows: List[Dict] = []
-    for ticker in TICKERS:
-        scores = by_ticker.get(ticker, [])
-        if not scores:
-            continue
-        avg = sum(scores) / len(scores)
-        rows.append(
-            {
-                "ticker": ticker,
-                "avg_polarity": round(avg, 3),
-                "recommendation": _recommendation_from_score(avg),
-                "news_count": len(scores),
-            }
-        )
+    logger.info("Analyzed %d articles with text (skipped %d empty items)", len(per_article), empty_count)
+
+    # Aggregate: mean and count per ticker in one groupby
+    df = pd.DataFrame(per_article, columns=["ticker", "polarity"]).dropna(subset=["ticker"])
+    agg = df.groupby("ticker", sort=False)["polarity"].agg(avg="mean", news_count="size")
+
+    # Keep the report in TICKERS order
+    agg = agg.reindex([t for t in TICKERS if t in agg.index])
+
+    avgs = agg["avg"].tolist()
+    report = pd.DataFrame(
+        {
+            "ticker": agg.index,
+            # Python round() so values match what the API reports
+            "avg_polarity": [round(avg, 3) for avg in avgs],
+            # Label from the unrounded average
+            "recommendation": [_recommendation_from_score(avg) for avg in avgs],
+            "news_count": agg["news_count"].to_numpy(),
+        },
+        columns=REPORT_COLUMNS,
+    )
     
-    print(f"Generated {len(rows)} recommendations")
-    if rows:
-        print(f"Sample: {rows[0]}")
+    logger.info("Generated %d recommendations", len(report))
+    if not report.empty:
+        logger.debug("Sample: %s", report.head(1).to_dict("records")[0])
     
-    return rows
+    return report
 
 
-def write_csv(rows: List[Dict]) -> Path:
+def write_csv(report: pd.DataFrame) -> Path:
     """
     Write recommendations to CSV.
     """
     OUTPUT_CSV.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = ["ticker", "avg_polarity", "recommendation", "news_count"]
-    with OUTPUT_CSV.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    # CRLF line endings, as csv.writer produced before
+    report.to_csv(OUTPUT_CSV, index=False, columns=REPORT_COLUMNS, encoding="utf-8", lineterminator="\r\n")
     return OUTPUT_CSV
 
 
@@ -127,10 +143,8 @@ def send_email_with_attachment(csv_path: Path) -> None:
     if not gmail_user or not gmail_pass or not recipient:
         raise RuntimeError("GMAIL_USER, GMAIL_APP_PASSWORD, and RECIPIENT_EMAIL must be set")
     
-    # Debug: show what we're using (mask password)
-    print(f"Attempting to send email from: {gmail_user}")
-    print(f"Password length: {len(gmail_pass)} characters")
-    print(f"Sending to: {recipient}")
+    # Addresses stay at DEBUG: INFO output is returned by /run-daily-report
+    logger.debug("Sending email from %s to %s", gmail_user, recipient)
 
     msg = EmailMessage()
     msg["Subject"] = f"Daily Investment Recommendations - {datetime.utcnow().strftime('%Y-%m-%d')}"
@@ -157,14 +171,15 @@ def send_email_with_attachment(csv_path: Path) -> None:
 
 
 def main() -> None:
-    rows = generate_recommendations()
-    if not rows:
+    report = generate_recommendations()
+    if report.empty:
         raise RuntimeError("No recommendations generated; aborting email send.")
-    csv_path = write_csv(rows)
+    csv_path = write_csv(report)
     send_email_with_attachment(csv_path)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(message)s")
     main()
 
 
@@ -1,24 +1,99 @@
 import streamlit as st
 import requests
+import numpy as np
 import pandas as pd
 import altair as alt
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 
 # Import combined US and Indian tickers
 from backend.us_tickers import US_TICKERS
 from backend.indian_tickers import INDIAN_TICKERS
 
 API_URL = "https://investment-script.onrender.com"
-TICKERS = US_TICKERS + INDIAN_TICKERS
+# Built once per server process rather than on every rerun; the tuple also
+# gives the ticker widgets a stable options object
+@st.cache_resource(show_spinner=False)
+def all_tickers() -> tuple:
+    return tuple(US_TICKERS) + tuple(INDIAN_TICKERS)
+
+TICKERS = all_tickers()
 
 # Page config
 st.set_page_config(page_title="Investment Recommendations", layout="wide")
 
 st.title("📈 US & Indian Market Investment Recommendations")
 
+# One keep-alive session for every backend call, shared across reruns
+@st.cache_resource
+def get_session() -> requests.Session:
+    return requests.Session()
+
+# Threads for fetching independent endpoints side by side
+@st.cache_resource
+def get_fetch_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=4)
+
+def _get_json(path: str, timeout: int, **params):
+    resp = get_session().get(f"{API_URL}{path}", params=params or None, timeout=timeout)
+    resp.raise_for_status()
+    return resp.json()
+
+# Backend responses are cached across reruns (widget changes re-run the whole
+# script); errors raise and are therefore never cached
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_recommendations():
+    return _get_json("/recommendations", timeout=120)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_news():
+    return _get_json("/news", timeout=120)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_sentiment():
+    return _get_json("/sentiment", timeout=120)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_sector_analysis():
+    return _get_json("/sector-analysis", timeout=30)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_compare(tickers_param: str):
+    return _get_json("/compare", timeout=30, tickers=tickers_param)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_price_chart(ticker: str, include_ohlc: bool):
+    return _get_json("/price_chart", timeout=15, ticker=ticker, include_ohlc=str(include_ohlc).lower())
+
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_price_charts(tickers: tuple):
+    # One /batch round trip for several tickers' charts
+    resp = get_session().post(
+        f"{API_URL}/batch",
+        json={"requests": [{"path": "/price_chart?" + urlencode({"ticker": t})} for t in tickers]},
+        timeout=30
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_analysis(ticker: str):
+    return _get_json(f"/analysis/{ticker}", timeout=15)
+
+# Fixed label sets stored as categoricals: filters, counts and groupbys then
+# compare small integer codes instead of strings
+MARKET_DTYPE = pd.CategoricalDtype(["US", "Indian"])
+RECOMMENDATION_DTYPE = pd.CategoricalDtype(["Buy", "Hold", "Sell"])
+
 # Helper function to determine market
 def get_market(ticker: str) -> str:
     return "Indian" if ticker.endswith((".NS", ".BO")) else "US"
 
+# Vectorized get_market for a whole ticker column (codes follow MARKET_DTYPE)
+def market_column(tickers: pd.Series) -> pd.Categorical:
+    is_indian = tickers.str.endswith((".NS", ".BO"), na=False).to_numpy()
+    return pd.Categorical.from_codes(np.where(is_indian, 1, 0), dtype=MARKET_DTYPE)
+
 # Helper function for color coding
 def get_recommendation_color(recommendation: str) -> str:
     colors = {"Buy": "🟢", "Hold": "🟡", "Sell": "🔴"}
@@ -26,19 +101,29 @@ def get_recommendation_color(recommendation: str) -> str:
 
 # Sidebar for filters and navigation
 st.sidebar.header("🔍 Filters & Navigation")
+if st.sidebar.button("🔄 Refresh data"):
+    st.cache_data.clear()
 
-# Main tabs
-tab1, tab2, tab3, tab4 = st.tabs(["📊 Dashboard", "📰 News", "💹 Price Charts", "📧 Reports"])
+# Main views. Unlike st.tabs, which runs every tab's body (and its API calls)
+# on each rerun, only the selected view is executed.
+VIEWS = ["📊 Dashboard", "📰 News", "💹 Price Charts", "📧 Reports"]
+view = st.radio("View", VIEWS, horizontal=True, label_visibility="collapsed", key="view")
 
 # ========== TAB 1: DASHBOARD ==========
-with tab1:
+if view == VIEWS[0]:
     # Summary metrics section
     st.subheader("📊 Market Overview")
     
+    # Recommendations and sector analysis are independent: request both at
+    # once so a cold load waits for the slower one, not their sum
+    pool = get_fetch_pool()
+    recs_future = pool.submit(fetch_recommendations)
+    sector_future = pool.submit(fetch_sector_analysis)
+    
     try:
         with st.spinner("Loading recommendations..."):
             try:
-                recs = requests.get(f"{API_URL}/recommendations", timeout=120).json()
+                recs = recs_future.result()
             except requests.exceptions.Timeout:
                 st.error("⏱️ Request timed out. The backend is fetching news for 109 stocks - this may take up to 2 minutes on first load. Please try again in a moment.")
                 st.stop()
@@ -50,15 +135,18 @@ with tab1:
             recs_df = pd.DataFrame(recs)
             
             # Add market column
-            recs_df["market"] = recs_df["ticker"].apply(get_market)
+            recs_df["market"] = market_column(recs_df["ticker"])
+            recs_df["recommendation"] = recs_df["recommendation"].astype(RECOMMENDATION_DTYPE)
             
             # Summary metrics
             col1, col2, col3, col4, col5 = st.columns(5)
             
             total_stocks = len(recs_df)
-            buy_count = len(recs_df[recs_df["recommendation"] == "Buy"])
-            hold_count = len(recs_df[recs_df["recommendation"] == "Hold"])
-            sell_count = len(recs_df[recs_df["recommendation"] == "Sell"])
+            # One pass over the categorical codes for all three counts
+            counts = recs_df["recommendation"].value_counts()
+            buy_count = int(counts.get("Buy", 0))
+            hold_count = int(counts.get("Hold", 0))
+            sell_count = int(counts.get("Sell", 0))
             avg_sentiment = recs_df["avg_polarity"].mean()
             
             with col1:
@@ -84,14 +172,15 @@ with tab1:
             with col3:
                 search_ticker = st.text_input("🔍 Search Ticker", placeholder="e.g., AAPL, TCS.NS")
             
-            # Apply filters
-            filtered_df = recs_df.copy()
+            # Apply filters: one combined mask, one selection (search is a literal, not a regex)
+            mask = np.ones(len(recs_df), dtype=bool)
             if market_filter:
-                filtered_df = filtered_df[filtered_df["market"].isin(market_filter)]
+                mask &= recs_df["market"].isin(market_filter).to_numpy()
             if rec_filter:
-                filtered_df = filtered_df[filtered_df["recommendation"].isin(rec_filter)]
+                mask &= recs_df["recommendation"].isin(rec_filter).to_numpy()
             if search_ticker:
-                filtered_df = filtered_df[filtered_df["ticker"].str.contains(search_ticker.upper(), case=False)]
+                mask &= recs_df["ticker"].str.contains(search_ticker.upper(), case=False, regex=False).to_numpy()
+            filtered_df = recs_df[mask]
             
             # Sort options
             sort_by = st.selectbox("Sort by", ["Sentiment (High to Low)", "Sentiment (Low to High)", "Ticker (A-Z)", "Ticker (Z-A)"])
@@ -115,7 +204,8 @@ with tab1:
                 display_cols.append("news_count")
             
             display_df = filtered_df[display_cols].copy()
-            display_df["recommendation"] = display_df["recommendation"].apply(
+            # Label each category once rather than every row
+            display_df["recommendation"] = display_df["recommendation"].cat.rename_categories(
                 lambda x: f"{get_recommendation_color(x)} {x}"
             )
             display_df["avg_polarity"] = display_df["avg_polarity"].apply(lambda x: f"{x:.3f}")
@@ -129,7 +219,7 @@ with tab1:
             
             # Market comparison chart
             st.subheader("📊 Market Comparison")
-            market_summary = recs_df.groupby("market")["recommendation"].value_counts().unstack(fill_value=0)
+            market_summary = recs_df.groupby("market", observed=True)["recommendation"].value_counts().unstack(fill_value=0)
             market_summary = market_summary.reindex(columns=["Buy", "Hold", "Sell"], fill_value=0)
             
             chart_data = market_summary.reset_index().melt(id_vars="market", var_name="Recommendation", value_name="Count")
@@ -149,7 +239,7 @@ with tab1:
             
             try:
                 with st.spinner("Loading sector analysis..."):
-                    sector_data = requests.get(f"{API_URL}/sector-analysis", timeout=30).json()
+                    sector_data = sector_future.result()
                 
                 if sector_data and "sectors" in sector_data:
                     sectors_list = sector_data["sectors"]
@@ -257,10 +347,7 @@ with tab1:
                 
                 try:
                     with st.spinner("Loading comparison data..."):
-                        compare_data = requests.get(
-                            f"{API_URL}/compare?tickers={tickers_param}",
-                            timeout=30
-                        ).json()
+                        compare_data = fetch_compare(tickers_param)
                     
                     if compare_data and "comparison" in compare_data:
                         comparison_list = compare_data["comparison"]
@@ -297,21 +384,21 @@ with tab1:
                         # Price comparison chart
                         st.write("### 💹 Price Comparison (30 Days)")
                         price_charts_data = []
-                        for ticker in selected_tickers:
-                            try:
-                                chart_data = requests.get(
-                                    f"{API_URL}/price_chart?ticker={ticker}",
-                                    timeout=10
-                                ).json()
-                                if chart_data.get("dates") and chart_data.get("closes"):
-                                    for date, close in zip(chart_data["dates"], chart_data["closes"]):
-                                        price_charts_data.append({
-                                            "Date": pd.to_datetime(date),
-                                            "Price": close,
-                                            "Ticker": ticker
-                                        })
-                            except Exception:
-                                continue
+                        try:
+                            # One round trip for every selected ticker's chart
+                            batch_data = fetch_price_charts(tuple(selected_tickers))
+                        except Exception:
+                            batch_data = {}
+                        for i, ticker in enumerate(selected_tickers):
+                            sub = batch_data.get(str(i)) or {}
+                            chart_data = sub.get("body") if sub.get("status") == 200 else None
+                            if chart_data and chart_data.get("dates") and chart_data.get("closes"):
+                                for date, close in zip(chart_data["dates"], chart_data["closes"]):
+                                    price_charts_data.append({
+                                        "Date": pd.to_datetime(date),
+                                        "Price": close,
+                                        "Ticker": ticker
+                                    })
                         
                         if price_charts_data:
                             price_df = pd.DataFrame(price_charts_data)
@@ -387,8 +474,12 @@ with tab1:
                 if st.button("📧 Send Test Email"):
                     try:
                         with st.spinner("Sending email..."):
-                            resp = requests.get(f"{API_URL}/run-daily-report", timeout=60)
-                        if resp.status_code == 200:
+                            resp = get_session().get(
+                                f"{API_URL}/run-daily-report", params={"background": "true"}, timeout=15
+                            )
+                        if resp.status_code == 202:
+                            st.success("✅ Report queued - the email should arrive in a few minutes.")
+                        elif resp.status_code == 200:
                             st.success("✅ Email sent successfully!")
                         else:
                             st.error(f"❌ Error {resp.status_code}: {resp.text}")
@@ -411,7 +502,7 @@ with tab1:
         st.error(f"❌ Error loading recommendations: {e}")
 
 # ========== TAB 2: NEWS ==========
-with tab2:
+if view == VIEWS[1]:
     st.subheader("📰 Latest Market News")
     
     # News filters
@@ -424,7 +515,7 @@ with tab2:
     try:
         with st.spinner("Loading news..."):
             try:
-                news = requests.get(f"{API_URL}/news", timeout=120).json()
+                news = fetch_news()
             except requests.exceptions.Timeout:
                 st.error("⏱️ News request timed out. Please try again in a moment.")
                 st.stop()
@@ -434,22 +525,47 @@ with tab2:
         
         if news and len(news) > 0:
             news_df = pd.DataFrame(news)
-            news_df["market"] = news_df["ticker"].apply(get_market)
+            news_df["market"] = market_column(news_df["ticker"])
             
             # Apply filters
+            mask = np.ones(len(news_df), dtype=bool)
             if news_market_filter:
-                news_df = news_df[news_df["market"].isin(news_market_filter)]
+                mask &= news_df["market"].isin(news_market_filter).to_numpy()
             if news_ticker_search:
-                news_df = news_df[news_df["ticker"].str.contains(news_ticker_search.upper(), case=False)]
+                mask &= news_df["ticker"].str.contains(news_ticker_search.upper(), case=False, regex=False).to_numpy()
+            news_df = news_df[mask]
             
             st.write(f"**Found {len(news_df)} articles**")
             
-            # Display news with clickable links
-            for idx, row in news_df.iterrows():
-                with st.expander(f"📰 {row['ticker']} - {row['title'][:80]}..."):
-                    st.write(f"**Publisher:** {row.get('publisher', 'Unknown')}")
-                    st.write(f"**Summary:** {row.get('summary', 'No summary available')}")
-                    if row.get('link'):
+            # Display news in one virtualized grid with clickable links (rather
+            # than an expander per article); details render for one article only
+            news_df = news_df.reindex(columns=["ticker", "title", "publisher", "summary", "link"])
+            st.dataframe(
+                news_df[["ticker", "title", "publisher", "link"]],
+                column_config={
+                    "ticker": "Ticker",
+                    "title": "Title",
+                    "publisher": "Publisher",
+                    "link": st.column_config.LinkColumn("Link", display_text="🔗 Open"),
+                },
+                use_container_width=True,
+                hide_index=True,
+            )
+            
+            if not news_df.empty:
+                titles = news_df["title"].fillna("").tolist()
+                tickers = news_df["ticker"].tolist()
+                selected = st.selectbox(
+                    "📰 Article details",
+                    range(len(news_df)),
+                    format_func=lambda i: f"{tickers[i]} - {titles[i][:80]}",
+                    key="news_article",
+                )
+                row = news_df.iloc[selected]
+                with st.expander(f"📰 {row['ticker']} - {titles[selected][:80]}...", expanded=True):
+                    st.write(f"**Publisher:** {row['publisher'] or 'Unknown'}")
+                    st.write(f"**Summary:** {row['summary'] or 'No summary available'}")
+                    if row['link']:
                         st.markdown(f"[🔗 Read full article]({row['link']})")
         else:
             st.info("No news available at the moment.")
@@ -459,7 +575,7 @@ with tab2:
         st.error(f"❌ Error loading news: {e}")
 
 # ========== TAB 3: PRICE CHARTS ==========
-with tab3:
+if view == VIEWS[2]:
     st.subheader("💹 Stock Price Charts & Analysis")
     
     col1, col2, col3 = st.columns([2, 1, 1])
@@ -483,18 +599,14 @@ with tab3:
         with st.spinner("Loading price data..."):
             # Request OHLC data if candlestick or volume is selected
             include_ohlc = chart_type == "Candlestick" or show_volume
-            response = requests.get(
-                f"{API_URL}/price_chart?ticker={chart_ticker}&include_ohlc={str(include_ohlc).lower()}",
-                timeout=15
-            )
-            
-            # Check for HTTP errors
-            if response.status_code != 200:
+            try:
+                chart_data = fetch_price_chart(chart_ticker, include_ohlc)
+            except requests.exceptions.HTTPError as e:
+                # Check for HTTP errors
+                response = e.response
                 error_detail = response.json().get("detail", "Unknown error") if response.headers.get("content-type", "").startswith("application/json") else response.text
                 st.error(f"❌ Error loading price data: {error_detail}")
                 st.stop()
-            
-            chart_data = response.json()
         
         # Validate we have the required data
         if chart_data.get("dates") and chart_data.get("closes") and len(chart_data.get("dates", [])) > 0:
@@ -601,7 +713,7 @@ with tab3:
                 # Fetch analysis data
                 try:
                     with st.spinner("Loading analysis data..."):
-                        analysis_data = requests.get(f"{API_URL}/analysis/{chart_ticker}", timeout=15).json()
+                        analysis_data = fetch_analysis(chart_ticker)
                     
                     # Technical Indicators
                     if analysis_data.get("technical"):
@@ -734,7 +846,7 @@ with tab3:
         st.error(f"❌ Error loading chart: {e}")
 
 # ========== TAB 4: SENTIMENT ANALYSIS ==========
-with tab4:
+if view == VIEWS[3]:
     st.subheader("📊 Detailed Sentiment Analysis")
     
     col1, col2 = st.columns(2)
@@ -746,7 +858,7 @@ with tab4:
     try:
         with st.spinner("Loading sentiment data (this may take a moment)..."):
             try:
-                sentiment = requests.get(f"{API_URL}/sentiment", timeout=120).json()
+                sentiment = fetch_sentiment()
             except requests.exceptions.Timeout:
                 st.error("⏱️ Sentiment request timed out. Please try again in a moment.")
                 st.stop()
@@ -756,24 +868,28 @@ with tab4:
         
         if sentiment:
             sentiment_df = pd.DataFrame(sentiment)
-            sentiment_df["market"] = sentiment_df["ticker"].apply(get_market)
+            sentiment_df["market"] = market_column(sentiment_df["ticker"])
             
             # Apply filters
+            mask = np.ones(len(sentiment_df), dtype=bool)
             if sentiment_market_filter:
-                sentiment_df = sentiment_df[sentiment_df["market"].isin(sentiment_market_filter)]
+                mask &= sentiment_df["market"].isin(sentiment_market_filter).to_numpy()
             if sentiment_ticker_search:
-                sentiment_df = sentiment_df[sentiment_df["ticker"].str.contains(sentiment_ticker_search.upper(), case=False)]
+                mask &= sentiment_df["ticker"].str.contains(sentiment_ticker_search.upper(), case=False, regex=False).to_numpy()
+            sentiment_df = sentiment_df[mask]
             
             st.write(f"**Found {len(sentiment_df)} sentiment analyses**")
             
             # Sentiment distribution chart
             st.subheader("Sentiment Distribution")
-            sentiment_bins = pd.cut(sentiment_df["polarity"], bins=[-1, -0.1, 0.1, 1], labels=["Negative", "Neutral", "Positive"])
-            sentiment_dist = sentiment_bins.value_counts()
+            # Bins are right-closed like pd.cut: <= -0.1 Negative, <= 0.1 Neutral, else Positive
+            polarity = sentiment_df["polarity"].dropna().to_numpy(dtype=float)
+            bin_idx = np.searchsorted([-0.1, 0.1], polarity, side="left")
+            sentiment_counts = np.bincount(bin_idx, minlength=3)
             
             dist_chart = alt.Chart(pd.DataFrame({
-                "Sentiment": sentiment_dist.index,
-                "Count": sentiment_dist.values
+                "Sentiment": ["Negative", "Neutral", "Positive"],
+                "Count": sentiment_counts
             })).mark_bar().encode(
                 x="Sentiment:N",
                 y="Count:Q",